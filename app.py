@@ -1,110 +1,270 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime
+import hashlib
+from itertools import groupby
+from operator import itemgetter
+import os
 from pathlib import Path
+import queue
 import re
 import subprocess
 import sys
+import threading
 import time
 from typing import Any
 
+import numpy as np
+import orjson
 import pandas as pd
 import streamlit as st
 
 from nasol import CollectorConfig, NasolAnalyst, NasolCollector, NasolRepository
 from nasol.parsing import ensure_season_list
 
+_EPISODE_SPLIT_RE = re.compile(r"(?m)^##\s+EPISODE\|")
+_LOG_ROW_FIELDS = itemgetter("created_at", "level", "message")
+_BACKGROUND_WORKER_PIDS: set[int] = set()
+_SEASON_OPTIONS = tuple(range(1, 30))
+_DEFAULT_SEASONS = (10, 11)
+_SEASON_SELECTOR_KEYS: dict[str, tuple[str, str, str, str]] = {}
+
+_APP_STYLES = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<style>
+@import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Sans+KR:wght@400;500;600;700&display=swap');
+
+html, body, [class*="css"]  {
+    font-family: 'IBM Plex Sans KR', sans-serif;
+}
+
+[data-testid="stAppViewContainer"] {
+    background: radial-gradient(circle at 15% 15%, #fff2d5 0%, transparent 40%),
+                radial-gradient(circle at 80% 10%, #d8e8ff 0%, transparent 35%),
+                linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
+}
+
+.title-card {
+    border-radius: 16px;
+    padding: 20px 22px;
+    background: rgba(255, 255, 255, 0.82);
+    border: 1px solid rgba(15, 23, 42, 0.08);
+    box-shadow: 0 10px 30px rgba(15, 23, 42, 0.06);
+    margin-bottom: 10px;
+}
+
+.info-chip {
+    display: inline-block;
+    padding: 4px 10px;
+    margin-right: 8px;
+    border-radius: 999px;
+    background: #0f172a;
+    color: #ffffff;
+    font-size: 12px;
+    font-weight: 600;
+}
+
+.result-card {
+    border-radius: 14px;
+    padding: 14px 16px;
+    background: rgba(255, 255, 255, 0.95);
+    border: 1px solid rgba(148, 163, 184, 0.35);
+    margin-bottom: 10px;
+}
+
+.result-title {
+    font-size: 16px;
+    font-weight: 700;
+    margin-bottom: 4px;
+    color: #0f172a;
+}
+
+.result-meta {
+    color: #334155;
+    font-size: 13px;
+}
+</style>
+"""
+
+_RAW_TABLE_COLUMNS = {
+    "season": "기수",
+    "round_number": "회차",
+    "episode_in_round": "에피소드",
+    "upload_date": "업로드일",
+    "title": "제목",
+    "channel_title": "채널",
+    "view_count": "조회수",
+    "comment_count": "댓글수",
+    "source": "수집경로",
+    "transcript_status": "대본상태",
+}
+_RAW_TABLE_DTYPES = {
+    "기수": "Int32",
+    "회차": "Int32",
+    "에피소드": "Int32",
+    "조회수": "Int64",
+    "댓글수": "Int64",
+}
+_JOB_TABLE_COLUMNS = [
+    "job_id",
+    "status",
+    "started_at",
+    "finished_at",
+    "total_candidates",
+    "kept_candidates",
+    "transcript_success",
+    "transcript_fail",
+]
+_RESULT_CARD_TEMPLATE = (
+    '<div class="result-card">'
+    '<div class="result-title">{title}</div>'
+    '<div class="result-meta">{meta}</div>'
+    "</div>"
+)
+_VIDEO_CARD_META_TEMPLATE = (
+    "{season}기 {round_label} / {episode}에피소드 | 업로드 {upload_date} | "
+    "조회수 {view_count:,} | 댓글수 {comment_count:,}"
+)
+_ANALYSIS_ITEM_META_TEMPLATE = (
+    "점수 {score:.2f} | {reason}<br/>조회수 {view_count:,} / 댓글수 {comment_count:,}"
+)
+_CODEX_JOB_META_TEMPLATE = "{kind_line}기수: {seasons}<br/>요청: {query}<br/>생성: {created_at}"
+_SUMMARY_ITEM_META_TEMPLATE = "{title}<br/>핵심 인물: {key_people}<br/>한 줄 요약: {one_line}"
 
-def inject_styles() -> None:
-    st.markdown(
-        """
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=IBM+Plex+Sans+KR:wght@400;500;600;700&display=swap');
-
-        html, body, [class*="css"]  {
-            font-family: 'IBM Plex Sans KR', sans-serif;
-        }
-
-        [data-testid="stAppViewContainer"] {
-            background: radial-gradient(circle at 15% 15%, #fff2d5 0%, transparent 40%),
-                        radial-gradient(circle at 80% 10%, #d8e8ff 0%, transparent 35%),
-                        linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
-        }
 
-        .title-card {
-            border-radius: 16px;
-            padding: 20px 22px;
-            background: rgba(255, 255, 255, 0.82);
-            border: 1px solid rgba(15, 23, 42, 0.08);
-            box-shadow: 0 10px 30px rgba(15, 23, 42, 0.06);
-            margin-bottom: 10px;
-        }
+def inject_styles() -> None:
+    # Streamlit drops any element that is not re-emitted on a rerun, so the
+    # stylesheet has to be sent every time; only the string itself is hoisted.
+    st.markdown(_APP_STYLES, unsafe_allow_html=True)
 
-        .info-chip {
-            display: inline-block;
-            padding: 4px 10px;
-            margin-right: 8px;
-            border-radius: 999px;
-            background: #0f172a;
-            color: #ffffff;
-            font-size: 12px;
-            font-weight: 600;
-        }
 
-        .result-card {
-            border-radius: 14px;
-            padding: 14px 16px;
-            background: rgba(255, 255, 255, 0.95);
-            border: 1px solid rgba(148, 163, 184, 0.35);
-            margin-bottom: 10px;
-        }
-
-        .result-title {
-            font-size: 16px;
-            font-weight: 700;
-            margin-bottom: 4px;
-            color: #0f172a;
-        }
-
-        .result-meta {
-            color: #334155;
-            font-size: 13px;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+def _season_selector_keys(prefix: str) -> tuple[str, str, str, str]:
+    keys = _SEASON_SELECTOR_KEYS.get(prefix)
+    if keys is None:
+        keys = (f"{prefix}_season_mode", f"{prefix}_single", f"{prefix}_range", f"{prefix}_multi")
+        _SEASON_SELECTOR_KEYS[prefix] = keys
+    return keys
 
 
 def season_selector(prefix: str) -> list[int]:
+    mode_key, single_key, range_key, multi_key = _season_selector_keys(prefix)
     mode = st.radio(
         "기수 선택 방식",
         options=["단일", "범위", "다중"],
         horizontal=True,
-        key=f"{prefix}_season_mode",
+        key=mode_key,
     )
     if mode == "단일":
-        season = st.selectbox("기수", list(range(1, 30)), index=9, key=f"{prefix}_single")
+        season = st.selectbox("기수", _SEASON_OPTIONS, index=9, key=single_key)
         return [season]
     if mode == "범위":
         season_range = st.slider(
             "기수 범위",
             min_value=1,
             max_value=29,
-            value=(10, 11),
-            key=f"{prefix}_range",
+            value=_DEFAULT_SEASONS,
+            key=range_key,
         )
         return list(range(season_range[0], season_range[1] + 1))
     seasons = st.multiselect(
         "기수 다중 선택",
-        options=list(range(1, 30)),
-        default=[10, 11],
-        key=f"{prefix}_multi",
+        options=_SEASON_OPTIONS,
+        default=_DEFAULT_SEASONS,
+        key=multi_key,
     )
     return ensure_season_list(seasons)
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_get_videos(
+    db_path: str,
+    seasons: tuple[int, ...],
+    transcript_only: bool | None,
+    main_only: bool | None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    return NasolRepository(db_path).get_videos(
+        seasons=list(seasons),
+        transcript_only=transcript_only,
+        main_only=main_only,
+        limit=limit,
+        include_transcript=False,
+    )
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_available_seasons(db_path: str) -> list[int]:
+    return NasolRepository(db_path).get_available_seasons()
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_default_seasons(db_path: str, count: int) -> list[int]:
+    return _cached_available_seasons(db_path)[-count:]
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_get_video_meta(db_path: str, video_id: str) -> dict[str, Any] | None:
+    return NasolRepository(db_path).get_video_meta(video_id)
+
+
+@st.cache_data(ttl=30, show_spinner=False, max_entries=32)
+def _cached_get_video_transcript(
+    db_path: str,
+    video_id: str,
+    include_segments: bool,
+) -> dict[str, Any] | None:
+    return NasolRepository(db_path).get_video_transcript(video_id, include_segments=include_segments)
+
+
+@st.cache_data(ttl=3, show_spinner=False)
+def _cached_recent_jobs(db_path: str, limit: int, status: str | None = None) -> list[dict[str, Any]]:
+    return NasolRepository(db_path).list_recent_jobs(limit=limit, status=status)
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _cached_analysis_views(db_path: str, limit: int) -> list[dict[str, Any]]:
+    return NasolRepository(db_path).list_analysis_views(limit=limit)
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _cached_analysis_view(
+    db_path: str,
+    view_id: int,
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+    return NasolRepository(db_path).get_analysis_view(view_id)
+
+
+def _clear_collection_caches() -> None:
+    _cached_get_videos.clear()
+    _cached_get_video_meta.clear()
+    _cached_get_video_transcript.clear()
+    _cached_available_seasons.clear()
+    _cached_default_seasons.clear()
+    _cached_recent_jobs.clear()
+
+
+def format_result_card(title: str, meta: str) -> str:
+    return _RESULT_CARD_TEMPLATE.format_map({"title": title, "meta": meta})
+
+
+def render_result_card(title: str, meta: str) -> None:
+    st.markdown(format_result_card(title, meta), unsafe_allow_html=True)
+
+
+def format_codex_job_card(job: dict[str, Any], kind_line: str = "") -> tuple[str, str]:
+    title = f"#{job['id']} | {job['status']}"
+    meta = _CODEX_JOB_META_TEMPLATE.format_map(
+        {
+            "kind_line": kind_line,
+            "seasons": ", ".join(str(s) for s in job["seasons"]) or "전체",
+            "query": job["query"],
+            "created_at": (job.get("created_at") or "")[:19],
+        }
+    )
+    return title, meta
+
+
 def format_round(round_number: int | None) -> str:
     return f"{round_number}회차" if round_number else "회차 미확정"
 
@@ -139,7 +299,7 @@ def parse_summary_result_markdown(result_text: str) -> list[dict[str, Any]]:
         except (TypeError, ValueError):
             return 0
 
-    sections = re.split(r"(?m)^##\s+EPISODE\|", result_text or "")
+    sections = _EPISODE_SPLIT_RE.split(result_text or "")
     if len(sections) <= 1:
         return []
 
@@ -177,34 +337,43 @@ def parse_summary_result_markdown(result_text: str) -> list[dict[str, Any]]:
             "evidence_links": [],
         }
         list_keys = {"chunk_storyline", "key_incidents", "highlights", "evidence_links"}
+        text_parts: dict[str, list[str]] = {"summary": [], "one_line": []}
         current_key: str | None = None
         for line in body_lines:
-            if line.startswith("- ") and ":" not in line:
-                loose_value = line[2:].strip()
-                if current_key in list_keys and loose_value:
-                    payload[current_key].append(loose_value)
-                continue
-
-            if line.startswith("- ") and ":" in line:
-                key, value = line[2:].split(":", 1)
+            lstripped = line.lstrip(" ")
+            indent = len(line) - len(lstripped)
+            if indent in (0, 2) and lstripped.startswith("- "):
+                body = lstripped[2:]
+                if indent == 2:
+                    sub_value = body.strip()
+                    if current_key in list_keys and sub_value:
+                        payload[current_key].append(sub_value)
+                    continue
+                if ":" not in body:
+                    loose_value = body.strip()
+                    if current_key in list_keys and loose_value:
+                        payload[current_key].append(loose_value)
+                    continue
+
+                key, value = body.split(":", 1)
                 current_key = key.strip().lower()
                 clean_value = value.strip()
                 if current_key in list_keys:
                     if clean_value:
                         payload[current_key].append(clean_value)
+                elif current_key in text_parts:
+                    text_parts[current_key] = [clean_value] if clean_value else []
                 elif current_key in payload:
                     payload[current_key] = clean_value
                 continue
 
-            if line.startswith("  - "):
-                sub_value = line[4:].strip()
-                if current_key in list_keys and sub_value:
-                    payload[current_key].append(sub_value)
-                continue
+            if current_key in text_parts:
+                stripped = line.strip()
+                if stripped:
+                    text_parts[current_key].append(stripped)
 
-            if current_key in {"summary", "one_line"}:
-                if line.strip():
-                    payload[current_key] = (payload[current_key] + " " + line.strip()).strip()
+        for key, parts in text_parts.items():
+            payload[key] = " ".join(parts)
 
         if not payload["chunk_storyline"] and payload["highlights"]:
             payload["chunk_storyline"] = list(payload["highlights"])
@@ -219,12 +388,56 @@ def parse_summary_result_markdown(result_text: str) -> list[dict[str, Any]]:
     return items
 
 
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_parse_summary(
+    job_id: int,
+    status: str,
+    text_digest: str,
+    _result_text: str,
+) -> list[dict[str, Any]]:
+    # `_result_text` is excluded from Streamlit's arg hashing; the digest keys it.
+    return parse_summary_result_markdown(_result_text)
+
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def _cached_segment_frame(
+    video_id: str,
+    segments_digest: str,
+    _segments_raw: str,
+) -> pd.DataFrame:
+    try:
+        segments = orjson.loads(_segments_raw)
+    except orjson.JSONDecodeError:
+        segments = []
+    if not segments:
+        return pd.DataFrame()
+    segment_count = len(segments)
+    starts = np.fromiter(
+        (float(segment.get("start", 0.0)) for segment in segments),
+        dtype=np.float64,
+        count=segment_count,
+    )
+    durations = np.fromiter(
+        (float(segment.get("duration", 0.0)) for segment in segments),
+        dtype=np.float64,
+        count=segment_count,
+    )
+    return pd.DataFrame(
+        {
+            "start_sec": np.round(starts, 2),
+            "duration_sec": np.round(durations, 2),
+            "text": [segment.get("text", "") for segment in segments],
+        }
+    )
+
+
 def spawn_background_collection(
     repo: NasolRepository,
     seasons: list[int],
     include_fallback: bool,
     dry_run: bool,
     force_refresh: bool,
+    force_metadata_refresh: bool,
 ) -> int:
     db_path = str(Path(repo.db_path).resolve())
     root_dir = str(Path(__file__).parent.resolve())
@@ -246,18 +459,103 @@ def spawn_background_collection(
         "1" if dry_run else "0",
         "--force-refresh",
         "1" if force_refresh else "0",
+        "--force-metadata-refresh",
+        "1" if force_metadata_refresh else "0",
     ]
-    with worker_log_path.open("a", encoding="utf-8") as log_file:
+    # Hand the child a raw append-mode fd; it writes straight to the file and
+    # we close our copy as soon as the process has been spawned.
+    log_fd = os.open(worker_log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        if hasattr(os, "posix_spawn"):
+            _reap_background_workers()
+            # posix_spawn avoids fork() copying the Streamlit server's page tables.
+            # It cannot chdir, so the package root is exposed via PYTHONPATH instead.
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(
+                path for path in (root_dir, env.get("PYTHONPATH")) if path
+            )
+            pid = os.posix_spawn(
+                sys.executable,
+                cmd,
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, log_fd, 1),
+                    (os.POSIX_SPAWN_DUP2, log_fd, 2),
+                ],
+                setsid=True,
+            )
+            _BACKGROUND_WORKER_PIDS.add(pid)
+            return int(pid)
+
         process = subprocess.Popen(  # noqa: S603
             cmd,
             cwd=root_dir,
-            stdout=log_file,
-            stderr=log_file,
+            stdout=log_fd,
+            stderr=log_fd,
             start_new_session=True,
         )
+    finally:
+        os.close(log_fd)
     return int(process.pid)
 
 
+def _reap_background_workers() -> None:
+    for pid in list(_BACKGROUND_WORKER_PIDS):
+        try:
+            finished_pid, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            finished_pid = pid
+        if finished_pid:
+            _BACKGROUND_WORKER_PIDS.discard(pid)
+
+
+def _run_foreground_collection(
+    collector: NasolCollector,
+    log_queue: queue.Queue[str],
+    result: dict[str, Any],
+    **collect_kwargs: Any,
+) -> None:
+    def append_log(message: str) -> None:
+        now = datetime.now().strftime("%H:%M:%S")
+        log_queue.put(f"[{now}] {message}")
+
+    try:
+        result["summary"] = collector.collect(logger=append_log, **collect_kwargs)
+    except Exception as exc:
+        result["error"] = str(exc)
+
+
+@st.fragment(run_every=0.5)
+def _render_foreground_collection() -> None:
+    # The collect runs on a worker thread; this fragment flushes its queued log lines in batches.
+    foreground_run = st.session_state.get("foreground_collection")
+    if not foreground_run:
+        return
+    log_queue = foreground_run["queue"]
+    logs = foreground_run["logs"]
+    while True:
+        try:
+            logs.append(log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if logs:
+        st.code("\n".join(logs[-180:]), language="text")
+    if foreground_run["thread"].is_alive():
+        st.caption("수집 작업을 실행 중입니다...")
+        return
+
+    del st.session_state["foreground_collection"]
+    result = foreground_run["result"]
+    if "summary" in result:
+        st.session_state["last_collection_summary"] = result["summary"]
+        st.session_state["foreground_collection_done"] = True
+    else:
+        st.session_state["foreground_collection_error"] = result.get("error") or "알 수 없는 오류"
+    # The run created a new job row and videos; refresh the whole page once.
+    _clear_collection_caches()
+    st.rerun(scope="app")
+
+
 def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> None:
     st.markdown("### 데이터 수집")
     st.caption(
@@ -265,7 +563,10 @@ def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> N
         "지볶행/나솔사계/사랑은 계속된다 등 스핀오프는 제외합니다."
     )
 
-    running_jobs = repo.list_recent_jobs(limit=5, status="running")
+    # The running-job guard queries by status so a stale "running" row older than the
+    # 20-row snapshot still blocks a second background run.
+    running_jobs = _cached_recent_jobs(str(repo.db_path), 5, "running")
+    recent_jobs = _cached_recent_jobs(str(repo.db_path), 20)
     has_running_job = bool(running_jobs)
 
     col_left, col_right = st.columns([2, 1], gap="large")
@@ -274,6 +575,7 @@ def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> N
         include_fallback = st.checkbox("공식 채널 누락 시 일반 검색 보완", value=True)
         dry_run = st.checkbox("Dry-run (영상 목록만 저장, 대본은 생략)", value=False)
         force_refresh = st.checkbox("기존 대본이 있어도 다시 수집", value=False)
+        force_metadata_refresh = st.checkbox("최근 조회한 영상 정보도 다시 조회", value=False)
         run_mode = st.radio(
             "실행 모드",
             options=["백그라운드(멀티프로세스)", "포그라운드(단일 프로세스)"],
@@ -296,8 +598,9 @@ def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> N
         )
 
     run_clicked = st.button("수집 시작", use_container_width=True, type="primary")
-    log_placeholder = st.empty()
+    log_container = st.container()
     status_placeholder = st.empty()
+    foreground_run = st.session_state.get("foreground_collection")
 
     if run_clicked:
         if not seasons:
@@ -311,28 +614,39 @@ def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> N
                 include_fallback=include_fallback,
                 dry_run=dry_run,
                 force_refresh=force_refresh,
+                force_metadata_refresh=force_metadata_refresh,
             )
             st.session_state["last_worker_pid"] = worker_pid
+            _clear_collection_caches()
             st.toast("백그라운드 수집 시작됨. Raw Data 탭으로 이동해 실시간 확인하세요.")
             status_placeholder.success(f"백그라운드 프로세스 시작 완료 (PID: {worker_pid})")
+        elif foreground_run and foreground_run["thread"].is_alive():
+            st.warning("이미 실행중인 포그라운드 수집 작업이 있습니다. 완료 후 다시 시작해주세요.")
         else:
-            logs: list[str] = []
-
-            def append_log(message: str) -> None:
-                now = datetime.now().strftime("%H:%M:%S")
-                logs.append(f"[{now}] {message}")
-                log_placeholder.code("\n".join(logs[-180:]), language="text")
-
-            with st.spinner("수집 작업을 실행 중입니다..."):
-                summary = collector.collect(
-                    seasons=seasons,
-                    include_fallback_search=include_fallback,
-                    dry_run=dry_run,
-                    force_transcript_refresh=force_refresh,
-                    logger=append_log,
-                )
-            st.session_state["last_collection_summary"] = summary
-            st.toast("포그라운드 수집 완료")
+            foreground_run = {"queue": queue.Queue(), "result": {}, "logs": []}
+            foreground_run["thread"] = threading.Thread(
+                target=_run_foreground_collection,
+                args=(collector, foreground_run["queue"], foreground_run["result"]),
+                kwargs={
+                    "seasons": seasons,
+                    "include_fallback_search": include_fallback,
+                    "dry_run": dry_run,
+                    "force_transcript_refresh": force_refresh,
+                    "force_metadata_refresh": force_metadata_refresh,
+                },
+                daemon=True,
+            )
+            foreground_run["thread"].start()
+            st.session_state["foreground_collection"] = foreground_run
+
+    if foreground_run:
+        with log_container:
+            _render_foreground_collection()
+    if st.session_state.pop("foreground_collection_done", False):
+        st.toast("포그라운드 수집 완료")
+    foreground_error = st.session_state.pop("foreground_collection_error", None)
+    if foreground_error:
+        status_placeholder.error(f"포그라운드 수집 실패: {foreground_error}")
 
     summary = st.session_state.get("last_collection_summary")
     if summary and not has_running_job:
@@ -345,14 +659,16 @@ def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> N
         st.info(f"실행중 수집 작업: {running_info}")
 
     st.markdown("### 작업 로그")
-    jobs = repo.list_recent_jobs(limit=20)
+    jobs = recent_jobs
     if jobs:
         job_map = {job["job_id"]: job for job in jobs}
+        job_ids = list(job_map)
+        job_index = {job_id: idx for idx, job_id in enumerate(job_ids)}
         default_job_id = running_jobs[0]["job_id"] if running_jobs else jobs[0]["job_id"]
         selected_job_id = st.selectbox(
             "조회할 작업 선택",
-            options=[job["job_id"] for job in jobs],
-            index=[job["job_id"] for job in jobs].index(default_job_id),
+            options=job_ids,
+            index=job_index.get(default_job_id, 0),
             format_func=lambda job_id: format_job_label(job_map[job_id]),
             key="collect_log_job_id",
         )
@@ -360,8 +676,10 @@ def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> N
         logs = repo.get_job_logs(selected_job_id, limit=500)
         if logs:
             log_text = "\n".join(
-                f"[{row['created_at'][11:19]}] {row['level']}: {row['message']}"
-                for row in logs
+                [
+                    f"[{created_at[11:19]}] {level}: {message}"
+                    for created_at, level, message in map(_LOG_ROW_FIELDS, logs)
+                ]
             )
             st.code(log_text, language="text")
         else:
@@ -379,24 +697,17 @@ def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> N
         st.caption("아직 실행된 작업이 없습니다.")
 
     st.markdown("### 최근 수집 작업")
-    jobs = repo.list_recent_jobs(limit=8)
+    jobs = recent_jobs[:8]
     if jobs:
-        job_df = pd.DataFrame(jobs)
-        job_df["started_at"] = job_df["started_at"].str.slice(0, 19)
-        job_df["finished_at"] = job_df["finished_at"].fillna("-").str.slice(0, 19)
+        job_df = pd.DataFrame.from_records(jobs, columns=_JOB_TABLE_COLUMNS)
+        for column, missing in (("started_at", ""), ("finished_at", "-")):
+            job_df[column] = (
+                pd.to_datetime(job_df[column], errors="coerce", utc=True, format="ISO8601")
+                .dt.strftime("%Y-%m-%dT%H:%M:%S")
+                .fillna(missing)
+            )
         st.dataframe(
-            job_df[
-                [
-                    "job_id",
-                    "status",
-                    "started_at",
-                    "finished_at",
-                    "total_candidates",
-                    "kept_candidates",
-                    "transcript_success",
-                    "transcript_fail",
-                ]
-            ],
+            job_df,
             use_container_width=True,
             hide_index=True,
         )
@@ -404,14 +715,97 @@ def render_collection_tab(repo: NasolRepository, collector: NasolCollector) -> N
         st.info("아직 실행된 수집 작업이 없습니다.")
 
 
+@st.fragment
+def _render_raw_table_section(
+    repo: NasolRepository,
+    videos: list[dict[str, Any]],
+    table_df: pd.DataFrame,
+) -> None:
+    # Row clicks rerun only this section; the video fetch and frame build above are skipped.
+    st.caption("행을 클릭하면 바로 아래 Transcript Raw Text가 열립니다.")
+    table_event = st.dataframe(
+        table_df,
+        use_container_width=True,
+        hide_index=True,
+        height=360,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="raw_data_table",
+    )
+
+    selected_video_id = st.session_state.get("raw_selected_video_id")
+    selected_rows: list[int] = []
+    try:
+        selected_rows = list(table_event.selection.rows)
+    except Exception:
+        selected_rows = []
+    if selected_rows:
+        # Table rows map 1:1 onto `videos`, so no id column is needed in the frame.
+        selected_video_id = videos[selected_rows[0]].get("video_id")
+        st.session_state["raw_selected_video_id"] = selected_video_id
+    elif not selected_video_id:
+        selected_video_id = videos[0].get("video_id")
+        st.session_state["raw_selected_video_id"] = selected_video_id
+
+    selected_video = (
+        _cached_get_video_meta(str(repo.db_path), selected_video_id) if selected_video_id else None
+    )
+    if not selected_video:
+        return
+
+    render_result_card(
+        str(selected_video.get("title")),
+        _VIDEO_CARD_META_TEMPLATE.format_map(
+            {
+                "season": selected_video.get("season"),
+                "round_label": format_round(
+                    selected_video.get("round_number") or selected_video.get("episode")
+                ),
+                "episode": selected_video.get("episode_in_round") or "?",
+                "upload_date": selected_video.get("upload_date"),
+                "view_count": int(selected_video.get("view_count") or 0),
+                "comment_count": int(selected_video.get("comment_count") or 0),
+            }
+        ),
+    )
+
+    # Transcript blobs are read separately from the card, and segments only on demand.
+    show_segments = st.toggle("세그먼트 타임라인 보기", value=False, key="raw_show_segments")
+    transcript = _cached_get_video_transcript(
+        str(repo.db_path),
+        selected_video["video_id"],
+        show_segments,
+    ) or {}
+    transcript_text = transcript.get("transcript_text") or ""
+    if transcript_text:
+        st.text_area(
+            "Transcript Raw Text",
+            value=transcript_text,
+            height=250,
+            key=f"raw_text_{selected_video['video_id']}",
+        )
+    else:
+        st.info("이 영상은 현재 대본이 없습니다.")
+
+    segments_raw = transcript.get("transcript_segments")
+    if segments_raw:
+        segment_df = _cached_segment_frame(
+            selected_video["video_id"],
+            hashlib.blake2b(segments_raw.encode("utf-8"), digest_size=8).hexdigest(),
+            segments_raw,
+        )
+        if not segment_df.empty:
+            st.dataframe(segment_df, use_container_width=True, height=260, hide_index=True)
+
+
 def render_raw_data_tab(repo: NasolRepository) -> None:
     st.markdown("### Raw Data 대시보드")
-    available_seasons = repo.get_available_seasons()
+    available_seasons = _cached_available_seasons(str(repo.db_path))
     if not available_seasons:
         st.info("수집된 데이터가 없습니다. 먼저 수집 탭에서 작업을 실행하세요.")
         return
 
-    default_seasons = available_seasons[-3:] if len(available_seasons) >= 3 else available_seasons
+    default_seasons = _cached_default_seasons(str(repo.db_path), 3)
     selected_seasons = st.multiselect(
         "기수 필터",
         options=available_seasons,
@@ -436,10 +830,11 @@ def render_raw_data_tab(repo: NasolRepository) -> None:
         key="raw_auto_refresh",
     )
 
-    videos = repo.get_videos(
-        seasons=selected_seasons,
-        transcript_only=transcript_only,
-        main_only=main_only,
+    videos = _cached_get_videos(
+        str(repo.db_path),
+        tuple(selected_seasons),
+        transcript_only,
+        main_only,
         limit=3000,
     )
     if not videos:
@@ -452,123 +847,44 @@ def render_raw_data_tab(repo: NasolRepository) -> None:
             st.warning("조건에 맞는 데이터가 없습니다.")
         return
 
+    records_df = pd.DataFrame.from_records(videos, columns=[*_RAW_TABLE_COLUMNS, "episode"])
+    records_df["round_number"] = records_df["round_number"].fillna(records_df["episode"])
+    table_df = (
+        records_df.drop(columns=["episode"])
+        .rename(columns=_RAW_TABLE_COLUMNS)
+        .astype(_RAW_TABLE_DTYPES)
+    )
+
     total_count = len(videos)
-    transcript_count = sum(1 for video in videos if video.get("transcript_status") == "success")
-    avg_engagement = (
-        sum(
-            (
-                (video.get("comment_count") or 0) / (video.get("view_count") or 1)
-                if (video.get("view_count") or 0) > 0
-                else 0
-            )
-            for video in videos
-        )
-        / total_count
+    view_counts = pd.to_numeric(records_df["view_count"], errors="coerce").to_numpy(dtype="float64")
+    comment_counts = (
+        pd.to_numeric(records_df["comment_count"], errors="coerce").fillna(0).to_numpy(dtype="float64")
     )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(view_counts > 0, comment_counts / view_counts, 0.0)
+    avg_engagement = float(ratios.mean())
+    transcript_count = int((records_df["transcript_status"] == "success").sum())
 
     m1, m2, m3 = st.columns(3)
     m1.metric("영상 수", f"{total_count:,}")
     m2.metric("대본 성공", f"{transcript_count:,}")
     m3.metric("평균 댓글비율", f"{avg_engagement * 100:.2f}%")
 
-    table_rows = []
-    for video in videos:
-        table_rows.append(
-            {
-                "기수": video.get("season"),
-                "회차": video.get("round_number") or video.get("episode"),
-                "에피소드": video.get("episode_in_round"),
-                "업로드일": video.get("upload_date"),
-                "제목": video.get("title"),
-                "채널": video.get("channel_title"),
-                "조회수": video.get("view_count"),
-                "댓글수": video.get("comment_count"),
-                "수집경로": video.get("source"),
-                "대본상태": video.get("transcript_status"),
-                "_video_id": video.get("video_id"),
-            }
-        )
-    table_df = pd.DataFrame(table_rows)
-    display_df = table_df.drop(columns=["_video_id"])
+    _render_raw_table_section(repo, videos, table_df)
 
-    st.caption("행을 클릭하면 바로 아래 Transcript Raw Text가 열립니다.")
-    table_event = st.dataframe(
-        display_df,
-        use_container_width=True,
-        hide_index=True,
-        height=360,
-        on_select="rerun",
-        selection_mode="single-row",
-        key="raw_data_table",
-    )
-
-    selected_video_id = st.session_state.get("raw_selected_video_id")
-    selected_rows: list[int] = []
-    try:
-        selected_rows = list(table_event.selection.rows)
-    except Exception:
-        selected_rows = []
-    if selected_rows:
-        selected_video_id = table_df.iloc[selected_rows[0]]["_video_id"]
-        st.session_state["raw_selected_video_id"] = selected_video_id
-    elif not selected_video_id and not table_df.empty:
-        selected_video_id = table_df.iloc[0]["_video_id"]
-        st.session_state["raw_selected_video_id"] = selected_video_id
-
-    selected_video = repo.get_video(selected_video_id) if selected_video_id else None
-    if not selected_video:
-        return
-
-    st.markdown(
-        f"""
-        <div class="result-card">
-            <div class="result-title">{selected_video.get('title')}</div>
-            <div class="result-meta">
-                {selected_video.get('season')}기 {format_round(selected_video.get('round_number') or selected_video.get('episode'))}
-                / {selected_video.get('episode_in_round') or '?'}에피소드 |
-                업로드 {selected_video.get('upload_date')} |
-                조회수 {int(selected_video.get('view_count') or 0):,} |
-                댓글수 {int(selected_video.get('comment_count') or 0):,}
-            </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    transcript_text = selected_video.get("transcript_text") or ""
-    if transcript_text:
-        st.text_area(
-            "Transcript Raw Text",
-            value=transcript_text,
-            height=250,
-            key=f"raw_text_{selected_video['video_id']}",
-        )
-    else:
-        st.info("이 영상은 현재 대본이 없습니다.")
-
-    segments_raw = selected_video.get("transcript_segments")
-    if segments_raw:
-        try:
-            segments = json.loads(segments_raw)
-        except json.JSONDecodeError:
-            segments = []
-        if segments:
-            segment_rows = [
-                {
-                    "start_sec": round(float(segment.get("start", 0.0)), 2),
-                    "duration_sec": round(float(segment.get("duration", 0.0)), 2),
-                    "text": segment.get("text", ""),
-                }
-                for segment in segments
-            ]
-            st.dataframe(pd.DataFrame(segment_rows), use_container_width=True, height=260, hide_index=True)
-
-    running_jobs = repo.list_recent_jobs(limit=1, status="running")
+    running_jobs = _cached_recent_jobs(str(repo.db_path), 1, "running")
+    if running_jobs:
+        # Collection is still writing rows; make the next rerun hit SQLite again.
+        _clear_collection_caches()
     if auto_refresh_raw and running_jobs:
         time.sleep(3)
         st.rerun()
 
 
+def _item_season(item: dict[str, Any]) -> int:
+    return int(item.get("season") or 0)
+
+
 def render_analysis_items(items: list[dict[str, Any]], title: str, key_prefix: str) -> None:
     st.markdown(f"#### {title}")
     seasons = sorted({int(item.get("season")) for item in items if item.get("season") is not None})
@@ -583,29 +899,39 @@ def render_analysis_items(items: list[dict[str, Any]], title: str, key_prefix: s
         default=seasons,
         key=filter_key,
     )
-    filtered_items = [item for item in items if int(item.get("season") or 0) in selected]
-
-    grouped: dict[int, list[dict[str, Any]]] = {}
-    for row in filtered_items:
-        season = int(row.get("season") or 0)
-        grouped.setdefault(season, []).append(row)
-
-    for season in sorted(grouped):
-        st.markdown(f"**{season}기**")
-        for row in grouped[season]:
-            round_label = format_round(row.get("episode"))
-            st.markdown(
-                f"""
-                <div class="result-card">
-                    <div class="result-title">{round_label} | {row.get("title")}</div>
-                    <div class="result-meta">
-                        점수 {float(row.get("score") or 0):.2f} | {row.get("reason")}<br/>
-                        조회수 {int(row.get("view_count") or 0):,} / 댓글수 {int(row.get("comment_count") or 0):,}
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
+    selected_set = set(selected)
+    filtered_items = [item for item in items if _item_season(item) in selected_set]
+    # Stable sort keeps the score order within each season for groupby.
+    filtered_items.sort(key=_item_season)
+
+    # One markdown element per season instead of one per card.
+    for season, rows in groupby(filtered_items, key=_item_season):
+        cards = [
+            format_result_card(
+                f"{format_round(row.get('episode'))} | {row.get('title')}",
+                _ANALYSIS_ITEM_META_TEMPLATE.format_map(
+                    {
+                        "score": float(row.get("score") or 0),
+                        "reason": row.get("reason"),
+                        "view_count": int(row.get("view_count") or 0),
+                        "comment_count": int(row.get("comment_count") or 0),
+                    }
+                ),
             )
+            for row in rows
+        ]
+        st.markdown(f"**{season}기**\n\n{''.join(cards)}", unsafe_allow_html=True)
+
+
+def _watch_codex_job_status(repo: NasolRepository, job_id: int, status: str) -> None:
+    # Only this fragment reruns on the timer; the full page reruns once the status moves.
+    @st.fragment(run_every=3)
+    def _poll_status() -> None:
+        job = repo.get_codex_job(job_id)
+        if job and job["status"] != status:
+            st.rerun(scope="app")
+
+    _poll_status()
 
 
 def render_codex_queue_mode(repo: NasolRepository) -> None:
@@ -622,11 +948,11 @@ def render_codex_queue_mode(repo: NasolRepository) -> None:
                 st.session_state["selected_codex_job_id"] = job["id"]
 
     with right:
-        available_seasons = repo.get_available_seasons()
+        available_seasons = _cached_available_seasons(str(repo.db_path))
         selected_seasons = st.multiselect(
             "분석 대상 기수",
             options=available_seasons,
-            default=available_seasons[-2:] if len(available_seasons) >= 2 else available_seasons,
+            default=_cached_default_seasons(str(repo.db_path), 2),
             key="analysis_seasons_codex",
         )
         st.caption(
@@ -646,30 +972,18 @@ def render_codex_queue_mode(repo: NasolRepository) -> None:
             return
 
         selected_job_id = st.session_state.get("selected_codex_job_id")
-        valid_ids = {job["id"] for job in jobs}
-        if selected_job_id is None or int(selected_job_id) not in valid_ids:
+        jobs_by_id = {job["id"]: job for job in jobs}
+        if selected_job_id is None or int(selected_job_id) not in jobs_by_id:
             selected_job_id = jobs[0]["id"]
             st.session_state["selected_codex_job_id"] = selected_job_id
 
-        selected_job = repo.get_codex_job(int(selected_job_id))
+        selected_job = jobs_by_id.get(int(selected_job_id))
         if not selected_job:
             st.warning("선택한 작업을 찾을 수 없습니다.")
             return
 
         st.markdown("#### 선택된 작업")
-        st.markdown(
-            f"""
-            <div class="result-card">
-                <div class="result-title">#{selected_job['id']} | {selected_job['status']}</div>
-                <div class="result-meta">
-                    기수: {', '.join(str(s) for s in selected_job['seasons']) or '전체'}<br/>
-                    요청: {selected_job['query']}<br/>
-                    생성: {(selected_job.get('created_at') or '')[:19]}
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        render_result_card(*format_codex_job_card(selected_job))
 
         if selected_job["status"] == "completed" and selected_job.get("result_text"):
             st.markdown("#### Codex 결과")
@@ -693,13 +1007,12 @@ def render_codex_queue_mode(repo: NasolRepository) -> None:
             key="codex_job_autorefresh",
         )
         if auto_refresh and selected_job["status"] in {"pending", "running"}:
-            time.sleep(3)
-            st.rerun()
+            _watch_codex_job_status(repo, int(selected_job["id"]), selected_job["status"])
 
 
 def render_summary_tab(repo: NasolRepository) -> None:
     st.markdown("### 요약 및 정리")
-    available_seasons = repo.get_available_seasons()
+    available_seasons = _cached_available_seasons(str(repo.db_path))
     if not available_seasons:
         st.info("요약할 대본 데이터가 없습니다. 먼저 수집 탭에서 대본을 수집해주세요.")
         return
@@ -717,7 +1030,7 @@ def render_summary_tab(repo: NasolRepository) -> None:
                 st.session_state["selected_summary_job_id"] = job["id"]
 
     with right:
-        default_seasons = available_seasons[-2:] if len(available_seasons) >= 2 else available_seasons
+        default_seasons = _cached_default_seasons(str(repo.db_path), 2)
         selected_seasons = st.multiselect(
             "요약 대상 기수",
             options=available_seasons,
@@ -744,31 +1057,18 @@ def render_summary_tab(repo: NasolRepository) -> None:
             return
 
         selected_job_id = st.session_state.get("selected_summary_job_id")
-        valid_ids = {job["id"] for job in jobs}
-        if selected_job_id is None or int(selected_job_id) not in valid_ids:
+        jobs_by_id = {job["id"]: job for job in jobs}
+        if selected_job_id is None or int(selected_job_id) not in jobs_by_id:
             selected_job_id = jobs[0]["id"]
             st.session_state["selected_summary_job_id"] = selected_job_id
 
-        selected_job = repo.get_codex_job(int(selected_job_id))
+        selected_job = jobs_by_id.get(int(selected_job_id))
         if not selected_job:
             st.warning("선택한 요약 작업을 찾을 수 없습니다.")
             return
 
         st.markdown("#### 선택된 요약 작업")
-        st.markdown(
-            f"""
-            <div class="result-card">
-                <div class="result-title">#{selected_job['id']} | {selected_job['status']}</div>
-                <div class="result-meta">
-                    작업: 요약(summary)<br/>
-                    기수: {', '.join(str(s) for s in selected_job['seasons']) or '전체'}<br/>
-                    요청: {selected_job['query']}<br/>
-                    생성: {(selected_job.get('created_at') or '')[:19]}
-                </div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
+        render_result_card(*format_codex_job_card(selected_job, kind_line="작업: 요약(summary)<br/>"))
 
         delete_col, confirm_col = st.columns([1.1, 2.3], gap="small")
         with delete_col:
@@ -798,20 +1098,28 @@ def render_summary_tab(repo: NasolRepository) -> None:
                     st.error("작업 삭제에 실패했습니다.")
 
         if selected_job["status"] == "completed" and selected_job.get("result_text"):
-            items = parse_summary_result_markdown(selected_job.get("result_text") or "")
+            result_text = selected_job.get("result_text") or ""
+            items = _cached_parse_summary(
+                int(selected_job["id"]),
+                selected_job["status"],
+                hashlib.blake2b(result_text.encode("utf-8"), digest_size=8).hexdigest(),
+                result_text,
+            )
             if not items:
                 st.warning("요약 결과 파싱에 실패했습니다. 아래 원문 결과를 확인해주세요.")
                 st.markdown(selected_job["result_text"])
             else:
                 st.markdown("#### 에피소드 요약 시각화")
-                season_options = sorted({item["season"] for item in items})
+                # Parsed items are already ordered by season, so an ordered dedupe suffices.
+                season_options = list(dict.fromkeys(item["season"] for item in items))
                 selected_filter = st.multiselect(
                     "기수 필터",
                     options=season_options,
                     default=season_options,
                     key=f"summary_result_filter_{selected_job['id']}",
                 )
-                filtered = [item for item in items if item["season"] in selected_filter]
+                selected_filter_set = set(selected_filter)
+                filtered = [item for item in items if item["season"] in selected_filter_set]
                 m1, m2 = st.columns(2)
                 m1.metric("요약 에피소드 수", f"{len(filtered):,}")
                 m2.metric("전체 에피소드 수", f"{len(items):,}")
@@ -828,43 +1136,31 @@ def render_summary_tab(repo: NasolRepository) -> None:
                     highlights = item.get("highlights") or []
                     evidence_links = item.get("evidence_links") or []
                     youtube_url = item.get("youtube_url") or ""
-                    st.markdown(
-                        f"""
-                        <div class="result-card">
-                            <div class="result-title">
-                                {item['season']}기 {round_label} / {episode_label}
-                            </div>
-                            <div class="result-meta">
-                                {title}<br/>
-                                핵심 인물: {key_people}<br/>
-                                한 줄 요약: {one_line}
-                            </div>
-                        </div>
-                        """,
-                        unsafe_allow_html=True,
+                    render_result_card(
+                        f"{item['season']}기 {round_label} / {episode_label}",
+                        _SUMMARY_ITEM_META_TEMPLATE.format_map(
+                            {"title": title, "key_people": key_people, "one_line": one_line}
+                        ),
                     )
+                    sections: list[str] = []
                     if youtube_url:
-                        st.markdown(f"[유튜브 바로가기]({youtube_url})")
-                    st.markdown(f"**요약**: {summary}")
+                        sections.append(f"[유튜브 바로가기]({youtube_url})")
+                    sections.append(f"**요약**: {summary}")
                     if chunk_storyline:
-                        st.markdown("**Chunk 흐름 요약**")
-                        for point in chunk_storyline:
-                            st.markdown(f"- {point}")
+                        sections.append("**Chunk 흐름 요약**\n" + "\n".join(f"- {point}" for point in chunk_storyline))
                     elif highlights:
-                        st.markdown("**핵심 포인트**")
-                        for point in highlights:
-                            st.markdown(f"- {point}")
+                        sections.append("**핵심 포인트**\n" + "\n".join(f"- {point}" for point in highlights))
                     if key_incidents:
-                        st.markdown("**핵심 사건**")
-                        for incident in key_incidents:
-                            st.markdown(f"- {incident}")
+                        sections.append("**핵심 사건**\n" + "\n".join(f"- {incident}" for incident in key_incidents))
                     if evidence_links:
-                        st.markdown("**근거 링크**")
-                        for link in evidence_links:
-                            if link.startswith("http"):
-                                st.markdown(f"- [링크]({link})")
-                            else:
-                                st.markdown(f"- {link}")
+                        sections.append(
+                            "**근거 링크**\n"
+                            + "\n".join(
+                                f"- [링크]({link})" if link.startswith("http") else f"- {link}"
+                                for link in evidence_links
+                            )
+                        )
+                    st.markdown("\n\n".join(sections))
 
                 with st.expander("요약 결과 원문 보기"):
                     st.markdown(selected_job["result_text"])
@@ -890,8 +1186,7 @@ def render_summary_tab(repo: NasolRepository) -> None:
             key="summary_job_autorefresh",
         )
         if auto_refresh and selected_job["status"] in {"pending", "running"}:
-            time.sleep(3)
-            st.rerun()
+            _watch_codex_job_status(repo, int(selected_job["id"]), selected_job["status"])
 
 
 def render_analysis_tab(repo: NasolRepository, analyst: NasolAnalyst) -> None:
@@ -911,7 +1206,7 @@ def render_analysis_tab(repo: NasolRepository, analyst: NasolAnalyst) -> None:
 
     with left:
         st.markdown("#### Saved Views")
-        views = repo.list_analysis_views(limit=20)
+        views = _cached_analysis_views(str(repo.db_path), 20)
         if not views:
             st.caption("아직 저장된 분석 View가 없습니다.")
         for view in views:
@@ -920,11 +1215,11 @@ def render_analysis_tab(repo: NasolRepository, analyst: NasolAnalyst) -> None:
                 st.session_state["selected_view_id"] = view["id"]
 
     with right:
-        available_seasons = repo.get_available_seasons()
+        available_seasons = _cached_available_seasons(str(repo.db_path))
         selected_seasons = st.multiselect(
             "분석 대상 기수",
             options=available_seasons,
-            default=available_seasons[-2:] if len(available_seasons) >= 2 else available_seasons,
+            default=_cached_default_seasons(str(repo.db_path), 2),
             key="analysis_seasons",
         )
 
@@ -943,6 +1238,7 @@ def render_analysis_tab(repo: NasolRepository, analyst: NasolAnalyst) -> None:
         if prompt:
             st.session_state["analysis_messages"].append({"role": "user", "content": prompt})
             result = analyst.answer(prompt, selected_seasons)
+            _cached_analysis_views.clear()
             st.session_state["analysis_messages"].append(
                 {"role": "assistant", "content": result["response"]}
             )
@@ -957,7 +1253,7 @@ def render_analysis_tab(repo: NasolRepository, analyst: NasolAnalyst) -> None:
 
         selected_view_id = st.session_state.get("selected_view_id")
         if selected_view_id:
-            view, items = repo.get_analysis_view(int(selected_view_id))
+            view, items = _cached_analysis_view(str(repo.db_path), int(selected_view_id))
             if view:
                 render_analysis_items(items, f"저장된 View: {view['name']}", f"saved_view_{view['id']}")
 
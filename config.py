@@ -25,3 +25,23 @@ TRANSCRIPT_LANGUAGES = ["ko", "ko-KR", "en", "en-US"]
 
 # 요청 딜레이 (초) - YouTube 차단 방지
 REQUEST_DELAY = 1.5
+
+# 동시 요청 워커 수 (요청 시작 간격은 평균 REQUEST_DELAY 유지)
+MAX_WORKERS = 8
+
+# 쉬는 동안 모아둘 수 있는 요청 수 - 이만큼은 간격 없이 바로 보낸다
+REQUEST_BURST = 4
+
+# 429/차단 응답을 받으면 요청 간격을 두 배로 늘리되 이 값(초)을 넘지 않음
+MAX_REQUEST_DELAY = 30.0
+
+# 이보다 짧은 검색 결과(쇼츠 등)는 상세 조회 후보에서 제외 (초, 0이면 제외 안 함)
+MIN_DURATION_SECONDS = 60
+
+# 상세 정보를 DETAIL_BATCH_SIZE개씩 조회하다가, 확정된 상위 N번째 조회수가
+# 남은 후보의 검색 결과 조회수보다 크면 나머지 후보 조회를 생략 (False면 후보 전체 조회)
+DETAIL_EARLY_STOP = True
+DETAIL_BATCH_SIZE = 25
+
+# 상세 정보·대본 캐시 유효 시간 (시간) - output/.cache 에 저장, --no-cache 로 무시
+CACHE_TTL_HOURS = 24
@@ -4,9 +4,13 @@
 이미 scraper.py를 실행했다면 이 스크립트로 대본만 빠르게 보완 가능
 """
 
+import csv
 import json
+import os
+import re
 import time
-import glob
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
@@ -16,6 +20,39 @@ from tqdm import tqdm
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_DIR = SCRIPT_DIR / "output"
 REQUEST_DELAY = 1.0
+MAX_WORKERS = 8
+CSV_FIELDS = [
+    "rank",
+    "video_id",
+    "title",
+    "url",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "duration_string",
+    "channel",
+    "upload_date",
+    "has_transcript",
+    "transcript_language",
+    "transcript_type",
+    "transcript_length",
+]
+
+_UNSAFE_TITLE_CHARS = re.compile(r"[^\w \-()\[\]]")
+
+_request_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _wait_request_slot():
+    # 요청 시작 간격만 REQUEST_DELAY로 맞추고, 응답 대기는 워커끼리 겹치게 둔다
+    global _next_request_at
+    with _request_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + REQUEST_DELAY
+    if wait > 0:
+        time.sleep(wait)
 
 
 def get_transcript(video_id: str) -> dict:
@@ -27,6 +64,7 @@ def get_transcript(video_id: str) -> dict:
         "transcript_segments": [],
     }
     try:
+        _wait_request_slot()
         api = YouTubeTranscriptApi()
         transcript_list = api.list(video_id)
 
@@ -58,17 +96,12 @@ def get_transcript(video_id: str) -> dict:
             result["has_transcript"] = True
             result["language"] = chosen.language_code
             result["transcript_type"] = chosen_type
-            result["transcript_segments"] = [
-                {
-                    "start": getattr(seg, "start", 0),
-                    "duration": getattr(seg, "duration", 0),
-                    "text": getattr(seg, "text", "").strip(),
-                }
+            segments = [
+                {"start": seg.start, "duration": seg.duration, "text": seg.text.strip()}
                 for seg in fetched
             ]
-            result["transcript_text"] = "\n".join(
-                s["text"] for s in result["transcript_segments"] if s["text"]
-            )
+            result["transcript_segments"] = segments
+            result["transcript_text"] = "\n".join(filter(None, (s["text"] for s in segments)))
     except NoTranscriptFound:
         result["transcript_type"] = "not_found"
     except TranscriptsDisabled:
@@ -81,32 +114,44 @@ def get_transcript(video_id: str) -> dict:
 def save_transcript_txt(video: dict, transcripts_dir: Path):
     if not video.get("has_transcript") or not video.get("transcript_text"):
         return
-    safe_title = "".join(
-        c for c in video.get("title", "")[:50] if c.isalnum() or c in " _-()[]"
-    ).strip()
+    safe_title = _UNSAFE_TITLE_CHARS.sub("", video.get("title", "")[:50]).strip()
     filename = f"{video['rank']:02d}_{video['video_id']}_{safe_title}.txt"
     txt_path = transcripts_dir / filename
-    with open(txt_path, "w", encoding="utf-8") as f:
-        f.write(f"제목: {video.get('title', '')}\n")
-        f.write(f"URL: {video.get('url', '')}\n")
-        f.write(f"채널: {video.get('channel', '')}\n")
-        f.write(f"업로드: {video.get('upload_date', '')}\n")
-        f.write(f"조회수: {video.get('view_count', 0):,}\n")
-        f.write(f"자막 언어: {video.get('language', '')}\n")
-        f.write(f"자막 유형: {video.get('transcript_type', '')}\n")
-        f.write("=" * 60 + "\n\n")
-        f.write(video.get("transcript_text", ""))
+    body = (
+        f"제목: {video.get('title', '')}\n"
+        f"URL: {video.get('url', '')}\n"
+        f"채널: {video.get('channel', '')}\n"
+        f"업로드: {video.get('upload_date', '')}\n"
+        f"조회수: {video.get('view_count', 0):,}\n"
+        f"자막 언어: {video.get('language', '')}\n"
+        f"자막 유형: {video.get('transcript_type', '')}\n"
+        f"{'=' * 60}\n\n"
+        f"{video.get('transcript_text', '')}"
+    )
+    txt_path.write_text(body, encoding="utf-8")
 
 
 def main():
     # 가장 최근 JSON 파일 로드
-    json_files = sorted(glob.glob(str(OUTPUT_DIR / "nasol_top50_*.json")))
-    if not json_files:
+    latest_entry = None
+    if OUTPUT_DIR.is_dir():
+        # 파일명에 타임스탬프가 들어가므로 이름 최댓값이 가장 최근 파일
+        with os.scandir(OUTPUT_DIR) as entries:
+            latest_entry = max(
+                (
+                    entry
+                    for entry in entries
+                    if entry.name.startswith("nasol_top50_") and entry.name.endswith(".json")
+                ),
+                key=lambda entry: entry.name,
+                default=None,
+            )
+    if latest_entry is None:
         print("[오류] output/ 디렉토리에 nasol_top50_*.json 파일이 없습니다.")
         print("  먼저 scraper.py를 실행해주세요.")
         return
 
-    latest_json = json_files[-1]
+    latest_json = latest_entry.path
     print(f"[로드] {latest_json}")
 
     with open(latest_json, encoding="utf-8") as f:
@@ -120,51 +165,56 @@ def main():
     print("[대본 수집 시작]")
     success = 0
 
-    for video in tqdm(videos, desc="  자막 다운로드"):
-        vid_id = video["video_id"]
-        transcript_data = get_transcript(vid_id)
-        video.update(transcript_data)
-
-        status = "✓" if transcript_data["has_transcript"] else "✗"
-        lang = transcript_data.get("language") or transcript_data.get("transcript_type", "")
-        tqdm.write(
-            f"  [{video['rank']:2d}] {status} {video['title'][:45]:<45} 자막:{lang}"
-        )
-
-        if transcript_data["has_transcript"]:
-            save_transcript_txt(video, transcripts_dir)
-            success += 1
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(get_transcript, video["video_id"]): video for video in videos}
+        for future in tqdm(as_completed(futures), total=len(futures), desc="  자막 다운로드"):
+            video = futures[future]
+            transcript_data = future.result()
+            video.update(transcript_data)
+
+            status = "✓" if transcript_data["has_transcript"] else "✗"
+            lang = transcript_data.get("language") or transcript_data.get("transcript_type", "")
+            tqdm.write(
+                f"  [{video['rank']:2d}] {status} {video['title'][:45]:<45} 자막:{lang}"
+            )
 
-        time.sleep(REQUEST_DELAY)
+            if transcript_data["has_transcript"]:
+                save_transcript_txt(video, transcripts_dir)
+                success += 1
 
     # 업데이트된 JSON 저장
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     out_json = OUTPUT_DIR / f"nasol_top50_{timestamp}.json"
+    # scraper.py와 같은 형식: 전문은 세그먼트에서 다시 만들 수 있으므로 JSON에는 세그먼트만 저장
+    json_videos = [
+        {key: value for key, value in v.items() if key != "transcript_text"} for v in videos
+    ]
     with open(out_json, "w", encoding="utf-8") as f:
-        json.dump(videos, f, ensure_ascii=False, indent=2)
+        json.dump(json_videos, f, ensure_ascii=False, indent=2)
 
     # CSV도 갱신
     try:
-        import pandas as pd
-        rows = [{
-            "rank": v.get("rank"),
-            "video_id": v.get("video_id"),
-            "title": v.get("title"),
-            "url": v.get("url"),
-            "view_count": v.get("view_count"),
-            "like_count": v.get("like_count"),
-            "comment_count": v.get("comment_count"),
-            "duration_string": v.get("duration_string"),
-            "channel": v.get("channel"),
-            "upload_date": v.get("upload_date"),
-            "has_transcript": v.get("has_transcript"),
-            "transcript_language": v.get("language"),
-            "transcript_type": v.get("transcript_type"),
-            "transcript_length": len(v.get("transcript_text", "")),
-        } for v in videos]
-        df = pd.DataFrame(rows)
         csv_path = OUTPUT_DIR / f"nasol_top50_{timestamp}.csv"
-        df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+        with open(csv_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for v in videos:
+                writer.writerow({
+                    "rank": v.get("rank"),
+                    "video_id": v.get("video_id"),
+                    "title": v.get("title"),
+                    "url": v.get("url"),
+                    "view_count": v.get("view_count"),
+                    "like_count": v.get("like_count"),
+                    "comment_count": v.get("comment_count"),
+                    "duration_string": v.get("duration_string"),
+                    "channel": v.get("channel"),
+                    "upload_date": v.get("upload_date"),
+                    "has_transcript": v.get("has_transcript"),
+                    "transcript_language": v.get("language"),
+                    "transcript_type": v.get("transcript_type"),
+                    "transcript_length": len(v.get("transcript_text", "")),
+                })
         print(f"\n  [저장] CSV: {csv_path}")
     except Exception:
         pass
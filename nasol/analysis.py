@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-import math
+import heapq
 import re
-from collections import defaultdict
 from datetime import datetime
+from itertools import groupby, islice
+from operator import itemgetter
 from typing import Any
 
+import numpy as np
+
 from nasol.parsing import parse_season_numbers
 from nasol.storage import NasolRepository
 
@@ -27,6 +30,22 @@ VILLAIN_KEYWORDS = (
     "폭발",
     "격해",
 )
+# Zero-width alternation so one scan counts every (possibly overlapping) keyword hit,
+# matching the per-keyword str.count totals.
+_VILLAIN_KEYWORD_RE = re.compile(f"(?=(?:{'|'.join(map(re.escape, VILLAIN_KEYWORDS))}))")
+_SEASON_RANGE_RE = re.compile(r"(\d{1,2})\s*(?:기)?\s*[~\-]\s*(\d{1,2})\s*기")
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+_QUERY_STOPWORDS = frozenset(("나는", "솔로", "영상"))
+_GROUPED_LINE_TEMPLATE = "- {episode_label} | {title} | {reason}"
+_MATCH_LINE_TEMPLATE = "- {season}기 {episode_label} | {title} (매칭:{match})"
+
+
+def _item_season(item: dict[str, Any]) -> int:
+    return int(item.get("season") or 0)
+
+
+def _episode_label(episode: Any) -> str:
+    return f"{episode}회차" if episode else "회차 미확정"
 
 
 class NasolAnalyst:
@@ -36,9 +55,16 @@ class NasolAnalyst:
     def answer(self, query: str, selected_seasons: list[int] | None = None) -> dict[str, Any]:
         available_seasons = self.repo.get_available_seasons()
         seasons = self._resolve_seasons(query, selected_seasons or [], available_seasons)
-        videos = self.repo.get_videos(seasons=seasons, transcript_only=True, main_only=True)
-
         mode = self._detect_mode(query)
+        # General search only keeps videos containing a query token, so SQLite can pre-filter.
+        match_any = self._tokenize(query) if mode == "general" else None
+        videos = self.repo.get_videos(
+            seasons=seasons,
+            transcript_only=True,
+            main_only=True,
+            match_any=match_any,
+            include_segments=False,
+        )
         if mode == "villain":
             result = self._build_villain_result(query, seasons, videos)
         elif mode == "hot":
@@ -46,18 +72,19 @@ class NasolAnalyst:
         else:
             result = self._build_general_result(query, seasons, videos)
 
-        self.repo.save_chat_exchange(query=query, seasons=seasons, response=result["response"])
+        view = None
         if result["items"] and result["save_view"]:
-            view_id = self.repo.save_analysis_view(
-                name=result["view_name"],
-                view_type=result["view_type"],
-                query=query,
-                seasons=seasons,
-                items=result["items"],
-            )
-            result["view_id"] = view_id
-        else:
-            result["view_id"] = None
+            view = {
+                "name": result["view_name"],
+                "view_type": result["view_type"],
+                "items": result["items"],
+            }
+        result["view_id"] = self.repo.save_analysis_exchange(
+            query=query,
+            seasons=seasons,
+            response=result["response"],
+            view=view,
+        )
 
         result["seasons"] = seasons
         result["mode"] = mode
@@ -82,7 +109,7 @@ class NasolAnalyst:
 
     def _extract_query_seasons(self, query: str) -> list[int]:
         seasons: set[int] = set(parse_season_numbers(query))
-        for start, end in re.findall(r"(\d{1,2})\s*(?:기)?\s*[~\-]\s*(\d{1,2})\s*기", query):
+        for start, end in _SEASON_RANGE_RE.findall(query):
             start_int = int(start)
             end_int = int(end)
             low, high = sorted((start_int, end_int))
@@ -103,12 +130,13 @@ class NasolAnalyst:
         self, query: str, seasons: list[int], videos: list[dict[str, Any]]
     ) -> dict[str, Any]:
         scored: list[dict[str, Any]] = []
-        for video in videos:
-            transcript_text = video.get("transcript_text") or ""
+        hit_counts = self._villain_keyword_hits(videos)
+        for video, keyword_hits in zip(videos, hit_counts):
             title = video.get("title") or ""
-            body = f"{title}\n{transcript_text[:12000]}".lower()
-            keyword_hits = sum(body.count(keyword) for keyword in VILLAIN_KEYWORDS)
-            engagement = self._engagement(video)
+            if keyword_hits < 2 and not video.get("view_count"):
+                # Without views the engagement term is 0, and one hit scores only 2.2.
+                continue
+            views, comments, engagement = self._video_metrics(video)
             score = keyword_hits * 2.2 + min(engagement * 12000, 15.0)
             if score < 2.5:
                 continue
@@ -120,15 +148,14 @@ class NasolAnalyst:
                     "title": title,
                     "url": video.get("url"),
                     "upload_date": video.get("upload_date"),
-                    "view_count": int(video.get("view_count") or 0),
-                    "comment_count": int(video.get("comment_count") or 0),
+                    "view_count": views,
+                    "comment_count": comments,
                     "score": round(score, 3),
                     "reason": f"갈등 키워드 {keyword_hits}회, 댓글비율 {engagement * 100:.2f}%",
                 }
             )
 
-        scored.sort(key=lambda row: row["score"], reverse=True)
-        top_items = scored[:30]
+        top_items = heapq.nlargest(30, scored, key=itemgetter("score"))
         response = self._render_grouped_response(
             header=f"{self._season_label(seasons)} 빌런/갈등 에피소드 후보",
             items=top_items,
@@ -147,13 +174,26 @@ class NasolAnalyst:
     def _build_hot_result(
         self, query: str, seasons: list[int], videos: list[dict[str, Any]]
     ) -> dict[str, Any]:
-        ranked: list[dict[str, Any]] = []
-        for video in videos:
-            views = int(video.get("view_count") or 0)
-            comments = int(video.get("comment_count") or 0)
-            engagement = self._engagement(video)
-            score = math.log10(views + 1) * 2.0 + math.log10(comments + 1) + engagement * 10000
-            ranked.append(
+        video_count = len(videos)
+        views = np.fromiter(
+            (int(video.get("view_count") or 0) for video in videos), dtype=np.int64, count=video_count
+        )
+        comments = np.fromiter(
+            (int(video.get("comment_count") or 0) for video in videos), dtype=np.int64, count=video_count
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            engagement = np.where(views > 0, comments / views, 0.0)
+        scores = np.log10(views + 1) * 2.0 + np.log10(comments + 1) + engagement * 10000
+        # Stable descending order on the displayed (rounded) score, like the old list sort.
+        top_indices = np.argsort(-np.round(scores, 3), kind="stable")[:30]
+
+        top_items: list[dict[str, Any]] = []
+        for index in top_indices.tolist():
+            video = videos[index]
+            view_count = int(views[index])
+            comment_count = int(comments[index])
+            ratio = float(engagement[index])
+            top_items.append(
                 {
                     "video_id": video["video_id"],
                     "season": video.get("season"),
@@ -161,14 +201,15 @@ class NasolAnalyst:
                     "title": video.get("title"),
                     "url": video.get("url"),
                     "upload_date": video.get("upload_date"),
-                    "view_count": views,
-                    "comment_count": comments,
-                    "score": round(score, 3),
-                    "reason": f"조회수 {views:,}, 댓글수 {comments:,}, 댓글비율 {engagement * 100:.2f}%",
+                    "view_count": view_count,
+                    "comment_count": comment_count,
+                    "score": round(float(scores[index]), 3),
+                    "reason": (
+                        f"조회수 {view_count:,}, 댓글수 {comment_count:,}, 댓글비율 {ratio * 100:.2f}%"
+                    ),
                 }
             )
-        ranked.sort(key=lambda row: row["score"], reverse=True)
-        top_items = ranked[:30]
+
         response = self._render_grouped_response(
             header=f"{self._season_label(seasons)} 화제성 상위 영상",
             items=top_items,
@@ -197,17 +238,20 @@ class NasolAnalyst:
                 "view_name": "",
             }
 
+        token_re = re.compile("|".join(map(re.escape, tokens)))
         matches: list[dict[str, Any]] = []
         for video in videos:
-            title = (video.get("title") or "").lower()
-            transcript = (video.get("transcript_text") or "").lower()
-            haystack = f"{title}\n{transcript[:16000]}"
-            token_score = sum(haystack.count(token) for token in tokens)
-            if token_score <= 0:
+            transcript_text = video.get("transcript_text") or ""
+            title_lower, text, end = self._search_parts(video, 16000)
+            # One scan rejects videos with no token at all before the per-token counts.
+            if not (token_re.search(title_lower) or token_re.search(text, 0, end)):
                 continue
-            engagement = self._engagement(video)
+            token_score = sum(title_lower.count(token) + text.count(token, 0, end) for token in tokens)
+            views, comments, engagement = self._video_metrics(video)
             score = token_score + engagement * 2000
-            snippet = self._snippet(video.get("transcript_text") or "", tokens)
+            snippet = self._snippet(
+                transcript_text, token_re, is_lower=bool(video.get("transcript_is_lower"))
+            )
             matches.append(
                 {
                     "video_id": video["video_id"],
@@ -216,16 +260,15 @@ class NasolAnalyst:
                     "title": video.get("title"),
                     "url": video.get("url"),
                     "upload_date": video.get("upload_date"),
-                    "view_count": int(video.get("view_count") or 0),
-                    "comment_count": int(video.get("comment_count") or 0),
+                    "view_count": views,
+                    "comment_count": comments,
                     "score": round(score, 3),
                     "reason": f"키워드 매칭 점수 {token_score}",
                     "snippet": snippet,
                 }
             )
 
-        matches.sort(key=lambda row: row["score"], reverse=True)
-        top_items = matches[:15]
+        top_items = heapq.nlargest(15, matches, key=itemgetter("score"))
 
         if not top_items:
             return {
@@ -238,10 +281,13 @@ class NasolAnalyst:
 
         lines = [f"{self._season_label(seasons)} 검색 결과입니다."]
         for item in top_items[:8]:
-            episode_label = f"{item['episode']}회차" if item.get("episode") else "회차 미확정"
             lines.append(
-                f"- {item['season']}기 {episode_label} | {item['title']} "
-                f"(매칭:{item['reason'].replace('키워드 매칭 점수 ', '')})"
+                _MATCH_LINE_TEMPLATE.format(
+                    season=item["season"],
+                    episode_label=_episode_label(item.get("episode")),
+                    title=item["title"],
+                    match=item["reason"].replace("키워드 매칭 점수 ", ""),
+                )
             )
             if item.get("snippet"):
                 lines.append(f"  ↳ {item['snippet']}")
@@ -258,44 +304,69 @@ class NasolAnalyst:
         if not items:
             return f"{header}\n- 결과 없음"
 
-        grouped: dict[int, list[dict[str, Any]]] = defaultdict(list)
-        for item in items:
-            season = int(item.get("season") or 0)
-            grouped[season].append(item)
-
         lines = [header]
-        for season in sorted(grouped):
+        # Stable sort keeps the score order inside each season group.
+        for season, rows in groupby(sorted(items, key=_item_season), key=_item_season):
             lines.append(f"\n{season}기")
-            for row in grouped[season][:8]:
-                episode = row.get("episode")
-                episode_label = f"{episode}회차" if episode else "회차 미확정"
-                lines.append(
-                    f"- {episode_label} | {row.get('title')} | {row.get('reason')}"
+            lines.extend(
+                _GROUPED_LINE_TEMPLATE.format(
+                    episode_label=_episode_label(row.get("episode")),
+                    title=row.get("title"),
+                    reason=row.get("reason"),
                 )
+                for row in islice(rows, 8)
+            )
         return "\n".join(lines)
 
-    def _engagement(self, video: dict[str, Any]) -> float:
+    def _search_parts(self, video: dict[str, Any], transcript_chars: int) -> tuple[str, str, int]:
+        # Terms never contain a newline, so title and transcript prefix are scanned separately
+        # instead of joining them into one body string.
+        title = (video.get("title") or "").lower()
+        transcript_text = video.get("transcript_text") or ""
+        if video.get("transcript_is_lower"):
+            # Flagged at ingestion: scan the stored text up to an end offset, no copy needed.
+            return title, transcript_text, transcript_chars
+        prefix = transcript_text[:transcript_chars].lower()
+        return title, prefix, len(prefix)
+
+    def _villain_keyword_hits(self, videos: list[dict[str, Any]]) -> list[int]:
+        # Each title and transcript prefix is scanned in place up to its end offset; joining
+        # them into one buffer would copy every prefix again.
+        hit_counts: list[int] = []
+        for video in videos:
+            title_lower, text, end = self._search_parts(video, 12000)
+            hit_counts.append(
+                len(_VILLAIN_KEYWORD_RE.findall(title_lower))
+                + len(_VILLAIN_KEYWORD_RE.findall(text, 0, end))
+            )
+        return hit_counts
+
+    def _video_metrics(self, video: dict[str, Any]) -> tuple[int, int, float]:
         views = int(video.get("view_count") or 0)
         comments = int(video.get("comment_count") or 0)
         if views <= 0:
-            return 0.0
-        return comments / views
+            return views, comments, 0.0
+        return views, comments, comments / views
 
     def _tokenize(self, text: str) -> list[str]:
-        tokens = [token.lower() for token in re.findall(r"[0-9A-Za-z가-힣]{2,}", text)]
-        return [token for token in tokens if token not in {"나는", "솔로", "영상"}]
+        return [
+            lowered
+            for token in _TOKEN_RE.findall(text)
+            if (lowered := token.lower()) not in _QUERY_STOPWORDS
+        ]
 
-    def _snippet(self, transcript: str, tokens: list[str], max_len: int = 100) -> str:
+    def _snippet(
+        self,
+        transcript: str,
+        token_re: re.Pattern[str],
+        max_len: int = 100,
+        is_lower: bool = False,
+    ) -> str:
         if not transcript:
             return ""
-        lowered = transcript.lower()
-        position = -1
-        chosen = ""
-        for token in tokens:
-            index = lowered.find(token)
-            if index >= 0 and (position == -1 or index < position):
-                position = index
-                chosen = token
+        # Leftmost match of the alternation is the earliest position of any token.
+        match = token_re.search(transcript if is_lower else transcript.lower())
+        position = match.start() if match else -1
 
         if position < 0:
             return transcript[:max_len].strip()
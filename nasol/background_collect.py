@@ -35,6 +35,18 @@ def main() -> int:
         choices=("0", "1"),
         help="Re-download transcript even if already exists",
     )
+    parser.add_argument(
+        "--force-metadata-refresh",
+        default="0",
+        choices=("0", "1"),
+        help="Re-fetch video details even if a recent cached copy exists",
+    )
+    parser.add_argument(
+        "--deep-metadata",
+        default="1",
+        choices=("0", "1"),
+        help="Fetch each video's page for counts and dates (0 uses listing entries only)",
+    )
 
     args = parser.parse_args()
     seasons = parse_seasons(args.seasons)
@@ -49,6 +61,8 @@ def main() -> int:
         include_fallback_search=args.include_fallback == "1",
         dry_run=args.dry_run == "1",
         force_transcript_refresh=args.force_refresh == "1",
+        force_metadata_refresh=args.force_metadata_refresh == "1",
+        deep_metadata=args.deep_metadata == "1",
         logger=print,
     )
     return 0
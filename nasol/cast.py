@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
+from functools import cache
 from typing import Any
 
-FREQUENT_CAST_NAMES = [
+FREQUENT_CAST_NAMES = (
     "영수",
     "영호",
     "영식",
@@ -16,14 +17,14 @@ FREQUENT_CAST_NAMES = [
     "영자",
     "옥순",
     "현숙",
-]
+)
 
-OCCASIONAL_CAST_NAMES = [
+OCCASIONAL_CAST_NAMES = (
     "경수",
     "정희",
     "정수",
     "정식",
-]
+)
 
 ALL_CAST_NAMES = FREQUENT_CAST_NAMES + OCCASIONAL_CAST_NAMES
 
@@ -35,6 +36,8 @@ _ASR_ALIAS_TO_CANONICAL = {
     "용철": "영철",
 }
 
+_ASR_ALIASES = tuple(_ASR_ALIAS_TO_CANONICAL)
+
 _SUFFIX_PATTERN = r"(?:님|씨|이|가|은|는|을|를|와|과|랑|하고|의|에게|한테)"
 _BOUNDARY_PATTERN = r"(?:\s|[.,!?;:(){}\[\]\"'“”‘’…/\-]|$)"
 _JOSA_SWAPS_TO_BATCHIM = {
@@ -45,44 +48,86 @@ _JOSA_SWAPS_TO_BATCHIM = {
     "랑": "이랑",
 }
 _JOSA_SWAPS_TO_NO_BATCHIM = {right: left for left, right in _JOSA_SWAPS_TO_BATCHIM.items()}
+_SWAPPABLE_JOSA = sorted(
+    {*_JOSA_SWAPS_TO_BATCHIM, *_JOSA_SWAPS_TO_NO_BATCHIM},
+    key=len,
+    reverse=True,
+)
+# One pass over the text for every alias: a josa directly before a boundary is captured so it
+# can be swapped for the canonical name's batchim, otherwise the alias needs a suffix/boundary.
+_CAST_ALIAS_RE = re.compile(
+    f"(?P<alias>{'|'.join(_ASR_ALIAS_TO_CANONICAL)})"
+    f"(?:(?P<josa>{'|'.join(_SWAPPABLE_JOSA)})(?={_BOUNDARY_PATTERN}))?"
+    f"(?=(?:{_SUFFIX_PATTERN}|{_BOUNDARY_PATTERN}))"
+)
 
 
 def _has_batchim(word: str) -> bool:
-    if not word:
-        return False
-    code = ord(word[-1])
-    if code < 0xAC00 or code > 0xD7A3:
-        return False
-    return (code - 0xAC00) % 28 != 0
+    return bool(word) and 0xAC00 <= (code := ord(word[-1])) <= 0xD7A3 and (code - 0xAC00) % 28 != 0
 
 
-def _normalize_alias_with_particle(text: str, wrong: str, right: str) -> str:
-    wrong_batchim = _has_batchim(wrong)
+def _alias_josa_swaps(wrong: str, right: str) -> dict[str, str]:
     right_batchim = _has_batchim(right)
-    if wrong_batchim == right_batchim:
-        return text
+    if _has_batchim(wrong) == right_batchim:
+        return {}
+    return _JOSA_SWAPS_TO_BATCHIM if right_batchim else _JOSA_SWAPS_TO_NO_BATCHIM
 
-    swap_map = _JOSA_SWAPS_TO_BATCHIM if right_batchim else _JOSA_SWAPS_TO_NO_BATCHIM
-    normalized = text
-    for from_josa, to_josa in swap_map.items():
-        normalized = re.sub(
-            fr"{wrong}{from_josa}(?={_BOUNDARY_PATTERN})",
-            f"{right}{to_josa}",
-            normalized,
-        )
-    return normalized
+
+# Batchim of each alias pair is fixed, so resolve the josa swap table once at import.
+_ALIAS_REWRITES = {
+    wrong: (right, _alias_josa_swaps(wrong, right))
+    for wrong, right in _ASR_ALIAS_TO_CANONICAL.items()
+}
 
 
-def normalize_cast_mentions(text: str) -> str:
-    normalized = text or ""
+def _canonical_char_sources() -> dict[str, str]:
+    # Characters that normalisation writes over a different stored character (용 -> 영).
+    sources: dict[str, str] = {}
     for wrong, right in _ASR_ALIAS_TO_CANONICAL.items():
-        normalized = _normalize_alias_with_particle(normalized, wrong, right)
-        normalized = re.sub(
-            fr"{wrong}(?=(?:{_SUFFIX_PATTERN}|{_BOUNDARY_PATTERN}))",
-            right,
-            normalized,
-        )
-    return normalized
+        for stored, normalized in zip(wrong, right):
+            if stored != normalized and stored not in sources.get(normalized, ""):
+                sources[normalized] = sources.get(normalized, "") + stored
+    return sources
+
+
+_CANONICAL_CHAR_SOURCES = _canonical_char_sources()
+_NORMALIZATION_KEEPS_LENGTH = all(
+    len(wrong) == len(right) and not swap_map for wrong, (right, swap_map) in _ALIAS_REWRITES.items()
+)
+
+
+def _rewrite_alias(match: re.Match[str]) -> str:
+    right, swap_map = _ALIAS_REWRITES[match.group("alias")]
+    josa = match.group("josa")
+    if not josa:
+        return right
+    return f"{right}{swap_map.get(josa, josa)}"
+
+
+def normalize_cast_mentions(text: str) -> str:
+    text = text or ""
+    # Most segments mention no alias at all; plain substring checks are cheaper than the regex.
+    if not any(alias in text for alias in _ASR_ALIASES):
+        return text
+    return _CAST_ALIAS_RE.sub(_rewrite_alias, text)
+
+
+def cast_search_glob(term: str) -> str | None:
+    """SQLite GLOB matching stored text whose lowercased, normalised form contains `term`.
+
+    Returns None when no such pattern can be built and callers must not pre-filter.
+    """
+    if not term or not _NORMALIZATION_KEEPS_LENGTH:
+        return None
+    parts: list[str] = []
+    for char in term:
+        if char in "*?[]":
+            return None
+        variants = char + _CANONICAL_CHAR_SOURCES.get(char, "")
+        if char.isascii() and char.isalpha():
+            variants = f"{char.lower()}{char.upper()}"
+        parts.append(f"[{variants}]" if len(variants) > 1 else char)
+    return f"*{''.join(parts)}*"
 
 
 def normalize_transcript_segments(segments: list[dict[str, Any]] | None) -> list[dict[str, Any]]:
@@ -122,6 +167,7 @@ def normalize_transcript(
     return normalized_text, normalized_segments
 
 
+@cache
 def cast_reference_text() -> str:
     frequent = ", ".join(FREQUENT_CAST_NAMES)
     occasional = ", ".join(OCCASIONAL_CAST_NAMES)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
-from collections import defaultdict
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import groupby
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator, TextIO
+
+import orjson
 
 from nasol.cast import (
     ALL_CAST_NAMES,
@@ -15,6 +19,29 @@ from nasol.cast import (
 )
 from nasol.storage import NasolRepository
 
+_SLUG_UNSAFE_RE = re.compile(r"[^0-9A-Za-z가-힣]+")
+_EPISODE_HEADER_RE = re.compile(r"(?m)^##\s+EPISODE\|")
+# One match per body line: `- key: value`, a `  - item`, or free text continuing the last key.
+_SECTION_LINE_RE = re.compile(
+    r"(?m)^(?:- (?P<key>[^:\n]*):(?P<value>[^\n]*)|  - (?P<item>[^\n]*)|(?P<text>[^\n]*))$"
+)
+_NON_SPACE_RE = re.compile(r"\S")
+_TRAILING_SPACE_RE = re.compile(r"\s*\Z")
+_OVERALL_SUMMARY_RE = re.compile(r"(?ms)^##\s*전체 요약\s*\n(.+?)(?:\n##\s+에피소드 요약|\Z)")
+_TRANSCRIPT_FIELDS = frozenset(("transcript_text", "transcript_segments"))
+_BANNED_SUMMARY_PATTERNS = (
+    "이 구간은",
+    "라는 제목 그대로",
+    "관계 구도가 다시 정리되는 에피소드",
+)
+_BANNED_SUMMARY_RE = re.compile("|".join(map(re.escape, _BANNED_SUMMARY_PATTERNS)))
+# Every cast name is two distinct Hangul syllables, so at most one name starts at a position
+# and the zero-width scan yields the same totals as one str.count per name. Longest names come
+# first so a longer name would win over a shorter one sharing its prefix.
+_CAST_NAME_RE = re.compile(
+    f"(?=({'|'.join(map(re.escape, sorted(ALL_CAST_NAMES, key=len, reverse=True)))}))"
+)
+
 
 def _season_label(seasons: list[int]) -> str:
     if not seasons:
@@ -54,45 +81,44 @@ def _seek_link(video_id: str, start_sec: int) -> str:
 
 
 def _slugify(text: str, max_len: int = 42) -> str:
-    normalized = re.sub(r"[^0-9A-Za-z가-힣]+", "-", (text or "").strip())
-    normalized = re.sub(r"-{2,}", "-", normalized).strip("-")
+    # Each unsafe run, dashes included, collapses to a single dash, so no second pass is needed.
+    normalized = _SLUG_UNSAFE_RE.sub("-", text or "").strip("-")
     return (normalized or "episode")[:max_len]
 
 
 def _extract_people(text: str, limit: int = 6) -> list[tuple[str, int]]:
-    lowered = normalize_cast_mentions(text or "").lower()
-    counts: list[tuple[str, int]] = []
-    for name in ALL_CAST_NAMES:
-        cnt = lowered.count(name.lower())
-        if cnt > 0:
-            counts.append((name, cnt))
-    counts.sort(key=lambda row: (-row[1], row[0]))
+    # Cast names are Hangul, which has no case, so the text is scanned without lowercasing it.
+    normalized = normalize_cast_mentions(text or "")
+    counts = sorted(Counter(_CAST_NAME_RE.findall(normalized)).items(), key=lambda row: (-row[1], row[0]))
     return counts[:limit]
 
 
 def _extract_canonical_people(text: str) -> list[str]:
-    normalized = normalize_cast_mentions(text or "")
-    found = [name for name in ALL_CAST_NAMES if name in normalized]
-    return found
+    found = set(_CAST_NAME_RE.findall(normalize_cast_mentions(text or "")))
+    return [name for name in ALL_CAST_NAMES if name in found]
 
 
 def _parse_summary_episode_sections(result_text: str) -> list[dict[str, Any]]:
-    sections = re.split(r"(?m)^##\s+EPISODE\|", result_text or "")
-    if len(sections) <= 1:
+    text = result_text or ""
+    headers = list(_EPISODE_HEADER_RE.finditer(text))
+    if not headers:
         return []
 
     items: list[dict[str, Any]] = []
     list_keys = {"chunk_storyline", "key_incidents", "evidence_links", "highlights"}
-    for raw_section in sections[1:]:
-        section = raw_section.strip()
-        if not section:
-            continue
-        lines = section.splitlines()
-        if not lines:
+    # Sections are scanned in place by offsets (whitespace-trimmed) rather than split out and copied.
+    for current, following in zip(headers, [*headers[1:], None]):
+        section_end = following.start() if following else len(text)
+        first_char = _NON_SPACE_RE.search(text, current.end(), section_end)
+        if not first_char:
             continue
+        start = first_char.start()
+        end = _TRAILING_SPACE_RE.search(text, start, section_end).start()
+        newline = text.find("\n", start, end)
+        header = text[start:end] if newline < 0 else text[start:newline]
 
         meta: dict[str, Any] = {}
-        for token in lines[0].split("|"):
+        for token in header.split("|"):
             if "=" not in token:
                 continue
             key, value = token.split("=", 1)
@@ -113,27 +139,31 @@ def _parse_summary_episode_sections(result_text: str) -> list[dict[str, Any]]:
             "evidence_links": [],
             "highlights": [],
         }
+        text_parts: dict[str, list[str]] = {"summary": [], "one_line": []}
         current_key: str | None = None
-        for line in lines[1:]:
-            if line.startswith("- ") and ":" in line:
-                key, value = line[2:].split(":", 1)
-                current_key = key.strip().lower()
-                clean = value.strip()
+        for match in _SECTION_LINE_RE.finditer(text, end if newline < 0 else newline + 1, end):
+            kind = match.lastgroup
+            if kind == "value":
+                current_key = match["key"].strip().lower()
+                clean = match["value"].strip()
                 if current_key in list_keys:
                     if clean:
                         payload[current_key].append(clean)
+                elif current_key in text_parts:
+                    text_parts[current_key] = [clean] if clean else []
                 elif current_key in payload:
                     payload[current_key] = clean
                 continue
 
-            if line.startswith("  - "):
-                clean = line[4:].strip()
+            clean = match[kind].strip()
+            if kind == "item":
                 if current_key in list_keys and clean:
                     payload[current_key].append(clean)
-                continue
+            elif current_key in text_parts and clean:
+                text_parts[current_key].append(clean)
 
-            if current_key in {"summary", "one_line"} and line.strip():
-                payload[current_key] = (payload[current_key] + " " + line.strip()).strip()
+        for key, parts in text_parts.items():
+            payload[key] = " ".join(parts)
 
         if not payload["chunk_storyline"] and payload["highlights"]:
             payload["chunk_storyline"] = payload["highlights"]
@@ -146,10 +176,7 @@ def _parse_summary_episode_sections(result_text: str) -> list[dict[str, Any]]:
 
 def _validate_summary_result(result_text: str) -> list[str]:
     errors: list[str] = []
-    summary_match = re.search(
-        r"(?ms)^##\s*전체 요약\s*\n(.+?)(?:\n##\s+에피소드 요약|\Z)",
-        result_text or "",
-    )
+    summary_match = _OVERALL_SUMMARY_RE.search(result_text or "")
     if not summary_match:
         errors.append("`## 전체 요약` 섹션이 없습니다.")
     else:
@@ -185,13 +212,8 @@ def _validate_summary_result(result_text: str) -> list[str]:
         if len(summary) < 200:
             errors.append(f"`video_id={video_id}` summary가 너무 짧습니다.")
 
-        lowered_summary = summary.lower()
-        banned_patterns = [
-            "이 구간은",
-            "라는 제목 그대로",
-            "관계 구도가 다시 정리되는 에피소드",
-        ]
-        if any(pattern in lowered_summary for pattern in banned_patterns):
+        # The banned phrases are Hangul and spaces only, so case folding cannot affect a match.
+        if _BANNED_SUMMARY_RE.search(summary):
             errors.append(
                 f"`video_id={video_id}` summary가 템플릿 문구 중심입니다. chunk 기반 사건 서사로 다시 작성해주세요."
             )
@@ -217,141 +239,150 @@ def _validate_summary_result(result_text: str) -> list[str]:
 
 
 def _parse_segments(raw: Any, text_fallback: str, chunk_chars: int) -> list[dict[str, Any]]:
-    if isinstance(raw, str) and raw.strip():
+    if isinstance(raw, (str, bytes)) and raw.strip():
         try:
-            parsed = json.loads(raw)
+            parsed = orjson.loads(raw)
             if isinstance(parsed, list):
                 clean = normalize_transcript_segments(parsed)
                 if clean:
                     return clean
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
     # Fallback: split transcript text into pseudo segments.
-    chunks = []
     text = normalize_cast_mentions((text_fallback or "").strip())
-    if not text:
-        return chunks
-    cursor = 0
-    while cursor < len(text):
-        snippet = text[cursor : cursor + chunk_chars]
-        chunks.append({"start": 0.0, "duration": 0.0, "text": snippet})
-        cursor += chunk_chars
-    return chunks
+    return [
+        {"start": 0.0, "duration": 0.0, "text": text[cursor : cursor + chunk_chars]}
+        for cursor in range(0, len(text), chunk_chars)
+    ]
 
 
 def _chunk_segments(segments: list[dict[str, Any]], chunk_chars: int = 1700) -> list[dict[str, Any]]:
-    if not segments:
-        return []
+    kept = [seg for seg in segments if seg.get("text", "")]
+    texts = [str(seg["text"]).strip() for seg in kept]
     chunks: list[dict[str, Any]] = []
-    current: list[dict[str, Any]] = []
+    first = 0
     current_chars = 0
 
-    for seg in segments:
-        text = seg.get("text", "")
-        if not text:
-            continue
-        if current and current_chars + len(text) > chunk_chars:
-            chunks.append(_finalize_chunk(current))
-            current = []
+    for index, seg in enumerate(kept):
+        size = len(seg["text"])
+        if index > first and current_chars + size > chunk_chars:
+            chunks.append(_finalize_chunk(kept[first], kept[index - 1], texts[first:index]))
+            first = index
             current_chars = 0
+        current_chars += size + 1
 
-        current.append(seg)
-        current_chars += len(text) + 1
-
-    if current:
-        chunks.append(_finalize_chunk(current))
+    if kept:
+        chunks.append(_finalize_chunk(kept[first], kept[-1], texts[first:]))
 
     return chunks
 
 
-def _finalize_chunk(segments: list[dict[str, Any]]) -> dict[str, Any]:
-    start = float(segments[0].get("start", 0.0) or 0.0)
-    last = segments[-1]
+def _finalize_chunk(first: dict[str, Any], last: dict[str, Any], texts: list[str]) -> dict[str, Any]:
+    start = float(first.get("start", 0.0) or 0.0)
     end = float(last.get("start", 0.0) or 0.0) + float(last.get("duration", 0.0) or 0.0)
-    text = " ".join(str(seg.get("text", "")).strip() for seg in segments).strip()
     return {
         "start": start,
         "end": max(end, start),
-        "text": text,
+        "text": " ".join(texts).strip(),
     }
 
 
-def _load_job_videos(
+# (transcript chunks, people counts) derived from one video's transcript.
+_PacketParts = tuple[list[dict[str, Any]], list[tuple[str, int]]]
+
+
+def _write_lines(fp: TextIO, lines: Iterable[str]) -> None:
+    # Same text as "\n".join(lines), written line by line instead of built in memory.
+    for index, line in enumerate(lines):
+        if index:
+            fp.write("\n")
+        fp.write(line)
+
+
+def _video_packet_parts(video: dict[str, Any], chunk_chars: int) -> _PacketParts:
+    segments = _parse_segments(
+        video.get("transcript_segments"),
+        text_fallback=video.get("transcript_text", ""),
+        chunk_chars=chunk_chars,
+    )
+    chunks = _chunk_segments(segments, chunk_chars=chunk_chars)
+    return chunks, _extract_people(video.get("transcript_text", ""))
+
+
+def _iter_job_videos(
     repo: NasolRepository,
     job: dict[str, Any],
     max_videos: int = 200,
-) -> list[dict[str, Any]]:
-    seasons = job.get("seasons") or []
-    videos = repo.get_videos(
-        seasons=seasons,
+) -> Iterator[dict[str, Any]]:
+    return repo.iter_videos(
+        seasons=job.get("seasons") or [],
         transcript_only=True,
         main_only=True,
         limit=max_videos,
+        episode_order=True,
     )
-    videos.sort(
-        key=lambda row: (
-            _to_int(row.get("season")),
-            _to_int(row.get("round_number") or row.get("episode") or 9999),
-            _to_int(row.get("episode_in_round") or 9999),
-            row.get("upload_date") or "",
-            row.get("video_id") or "",
-        )
-    )
-    return videos
 
 
-def build_context_markdown(
+def _load_job_videos(
+    repo: NasolRepository,
+    job: dict[str, Any],
+    max_videos: int = 200,
+) -> list[dict[str, Any]]:
+    return list(_iter_job_videos(repo, job, max_videos=max_videos))
+
+
+def _context_lines(
     repo: NasolRepository,
     job: dict[str, Any],
     max_videos: int = 80,
     chunk_chars: int = 1700,
-) -> str:
+    video_parts: dict[str, _PacketParts] | None = None,
+    videos: list[dict[str, Any]] | None = None,
+) -> Iterator[str]:
     seasons = job.get("seasons") or []
     kind = _job_kind(job)
-    videos = _load_job_videos(repo, job, max_videos=max_videos)
-    grouped: dict[int, list[dict[str, Any]]] = defaultdict(list)
-    for video in videos:
-        grouped[int(video.get("season") or 0)].append(video)
+    if videos is None:
+        videos = _load_job_videos(repo, job, max_videos=max_videos)
 
-    lines: list[str] = []
     title = "Codex 요약 요청" if kind == "summary" else "Codex 분석 요청"
-    lines.append(f"# {title} #{job['id']}")
-    lines.append("")
-    lines.append(f"- 상태: {job['status']}")
-    lines.append(f"- 작업종류: {kind}")
-    lines.append(f"- 기수: {_season_label(seasons)}")
-    lines.append(f"- 요청: {job['query']}")
-    lines.append(f"- 생성시각: {job['created_at']}")
-    lines.append("")
-    lines.append("## 데이터 요약")
-    lines.append(f"- 본편 대본 보유 영상 수: {len(videos)}")
+    yield f"# {title} #{job['id']}"
+    yield ""
+    yield f"- 상태: {job['status']}"
+    yield f"- 작업종류: {kind}"
+    yield f"- 기수: {_season_label(seasons)}"
+    yield f"- 요청: {job['query']}"
+    yield f"- 생성시각: {job['created_at']}"
+    yield ""
+    yield "## 데이터 요약"
+    yield f"- 본편 대본 보유 영상 수: {len(videos)}"
     if kind == "summary":
-        lines.append("- 요약 방식: 에피소드별 transcript chunk 단위 처리 후 에피소드 핵심 줄거리 생성")
+        yield "- 요약 방식: 에피소드별 transcript chunk 단위 처리 후 에피소드 핵심 줄거리 생성"
     else:
-        lines.append("- 분석 방식: 에피소드별 transcript chunk 단위로 먼저 이해한 뒤 최종 요약")
-    lines.append("- 인물명 보정: 캐스트 사전을 기준으로 ASR 이름 오탈자를 우선 교정")
-    lines.append("")
-    lines.append("## 캐스트 레퍼런스")
-    lines.append(f"```text\n{cast_reference_text()}\n```")
-    lines.append("")
-    lines.append("## 결과 작성 규칙")
+        yield "- 분석 방식: 에피소드별 transcript chunk 단위로 먼저 이해한 뒤 최종 요약"
+    yield "- 인물명 보정: 캐스트 사전을 기준으로 ASR 이름 오탈자를 우선 교정"
+    yield ""
+    yield "## 캐스트 레퍼런스"
+    yield f"```text\n{cast_reference_text()}\n```"
+    yield ""
+    yield "## 결과 작성 규칙"
     if kind == "summary":
-        lines.append("- 에피소드마다 chunk를 순서대로 읽고, chunk별 핵심 사건을 먼저 요약한 뒤 최종 요약을 작성합니다.")
-        lines.append("- 에피소드마다 핵심 인물(2명 이상), 사건(2개 이상), 근거 링크(2개 이상)를 포함합니다.")
-        lines.append("- `summary`는 템플릿 문구(예: `이 구간은`, `라는 제목 그대로`)를 금지합니다.")
-        lines.append("- 결과 파일은 `EPISODE|season=...|round=...|episode=...|video_id=...` 헤더 형식을 지킵니다.")
+        yield "- 에피소드마다 chunk를 순서대로 읽고, chunk별 핵심 사건을 먼저 요약한 뒤 최종 요약을 작성합니다."
+        yield "- 에피소드마다 핵심 인물(2명 이상), 사건(2개 이상), 근거 링크(2개 이상)를 포함합니다."
+        yield "- `summary`는 템플릿 문구(예: `이 구간은`, `라는 제목 그대로`)를 금지합니다."
+        yield "- 결과 파일은 `EPISODE|season=...|round=...|episode=...|video_id=...` 헤더 형식을 지킵니다."
     else:
-        lines.append("- 최소 8문장 이상으로 사건 서사를 작성합니다.")
-        lines.append("- 사건마다 `누가/왜/어떻게/결과`를 반드시 포함합니다.")
-        lines.append("- 사건마다 핵심 인물(2명 이상)과 관련 유튜브 링크를 넣습니다.")
-        lines.append("- 링크는 가능하면 사건 시작 지점 timestamp 링크를 우선 사용합니다.")
-    lines.append("")
-    lines.append("## 에피소드 작업 단위")
-    for season in sorted(grouped):
-        lines.append("")
-        lines.append(f"### {season}기")
-        for video in grouped[season]:
+        yield "- 최소 8문장 이상으로 사건 서사를 작성합니다."
+        yield "- 사건마다 `누가/왜/어떻게/결과`를 반드시 포함합니다."
+        yield "- 사건마다 핵심 인물(2명 이상)과 관련 유튜브 링크를 넣습니다."
+        yield "- 링크는 가능하면 사건 시작 지점 timestamp 링크를 우선 사용합니다."
+    yield ""
+    yield "## 에피소드 작업 단위"
+    # _load_job_videos sorts by season first, so each season is one contiguous run.
+    for season, season_videos in groupby(videos, key=lambda video: _to_int(video.get("season"))):
+        yield ""
+        yield f"### {season}기"
+        for video in season_videos:
             round_number = video.get("round_number") or video.get("episode")
             epi = video.get("episode_in_round")
             title = video.get("title") or ""
@@ -359,39 +390,57 @@ def build_context_markdown(
             view_count = _to_int(video.get("view_count"))
             comment_count = _to_int(video.get("comment_count"))
             ratio = (comment_count / view_count * 100.0) if view_count > 0 else 0.0
-            segments = _parse_segments(
-                video.get("transcript_segments"),
-                text_fallback=video.get("transcript_text", ""),
-                chunk_chars=chunk_chars,
-            )
-            chunks = _chunk_segments(segments, chunk_chars=chunk_chars)
-            people = _extract_people(video.get("transcript_text", ""))
+            parts = (video_parts or {}).get(video_id)
+            chunks, people = parts or _video_packet_parts(video, chunk_chars)
             people_text = ", ".join(f"{name}({cnt})" for name, cnt in people) or "감지 없음"
 
-            lines.append(
+            yield (
                 f"- [{video_id}] {round_number}회차/{epi or '?'}에피소드 | {title}"
             )
-            lines.append(
+            yield (
                 f"  - 지표: 조회수 {view_count:,}, 댓글수 {comment_count:,}, 댓글비율 {ratio:.3f}%"
             )
-            lines.append(f"  - 인물 힌트: {people_text}")
-            lines.append(f"  - 전체 링크: {_video_link(video_id)}")
+            yield f"  - 인물 힌트: {people_text}"
+            yield f"  - 전체 링크: {_video_link(video_id)}"
             for idx, chunk in enumerate(chunks[:2], start=1):
                 start = int(chunk["start"])
                 end = int(chunk["end"])
-                lines.append(
+                yield (
                     f"  - Chunk {idx} ({_sec_to_clock(start)}~{_sec_to_clock(end)}): "
                     f"{_seek_link(video_id, start)}"
                 )
-                lines.append(f"    - 발췌: {chunk['text'][:320]}...")
-    return "\n".join(lines)
+                yield f"    - 발췌: {chunk['text'][:320]}..."
 
 
-def build_episode_packet_markdown(
+def build_context_markdown(
+    repo: NasolRepository,
+    job: dict[str, Any],
+    max_videos: int = 80,
+    chunk_chars: int = 1700,
+    video_parts: dict[str, _PacketParts] | None = None,
+    videos: list[dict[str, Any]] | None = None,
+) -> str:
+    return "\n".join(_context_lines(repo, job, max_videos, chunk_chars, video_parts, videos))
+
+
+def write_context_markdown(
+    fp: TextIO,
+    repo: NasolRepository,
+    job: dict[str, Any],
+    max_videos: int = 80,
+    chunk_chars: int = 1700,
+    video_parts: dict[str, _PacketParts] | None = None,
+    videos: list[dict[str, Any]] | None = None,
+) -> None:
+    _write_lines(fp, _context_lines(repo, job, max_videos, chunk_chars, video_parts, videos))
+
+
+def _episode_packet_lines(
     video: dict[str, Any],
     chunk_chars: int = 1700,
     job_kind: str = "analysis",
-) -> str:
+    parts: _PacketParts | None = None,
+) -> Iterator[str]:
     video_id = video["video_id"]
     round_number = video.get("round_number") or video.get("episode")
     episode_in_round = video.get("episode_in_round")
@@ -399,85 +448,124 @@ def build_episode_packet_markdown(
     view_count = _to_int(video.get("view_count"))
     comment_count = _to_int(video.get("comment_count"))
     ratio = (comment_count / view_count * 100.0) if view_count > 0 else 0.0
-    people = _extract_people(video.get("transcript_text", ""))
+    chunks, people = parts or _video_packet_parts(video, chunk_chars)
     people_text = ", ".join(f"{name}({cnt})" for name, cnt in people) or "감지 없음"
 
-    segments = _parse_segments(
-        video.get("transcript_segments"),
-        text_fallback=video.get("transcript_text", ""),
-        chunk_chars=chunk_chars,
-    )
-    chunks = _chunk_segments(segments, chunk_chars=chunk_chars)
-
-    lines: list[str] = []
-    lines.append(f"# {video.get('season')}기-{round_number}회차-{episode_in_round or '?'}에피소드")
-    lines.append("")
-    lines.append(f"- video_id: `{video_id}`")
-    lines.append(f"- 제목: {title}")
-    lines.append(f"- 업로드일: {video.get('upload_date')}")
-    lines.append(f"- 조회수: {view_count:,}")
-    lines.append(f"- 댓글수: {comment_count:,}")
-    lines.append(f"- 댓글비율: {ratio:.3f}%")
-    lines.append(f"- 인물 힌트: {people_text}")
-    lines.append("```text")
-    lines.append(cast_reference_text())
-    lines.append("```")
-    lines.append(f"- 전체 링크: {_video_link(video_id)}")
-    lines.append("")
-    lines.append("## Codex 작업 지시")
+    yield f"# {video.get('season')}기-{round_number}회차-{episode_in_round or '?'}에피소드"
+    yield ""
+    yield f"- video_id: `{video_id}`"
+    yield f"- 제목: {title}"
+    yield f"- 업로드일: {video.get('upload_date')}"
+    yield f"- 조회수: {view_count:,}"
+    yield f"- 댓글수: {comment_count:,}"
+    yield f"- 댓글비율: {ratio:.3f}%"
+    yield f"- 인물 힌트: {people_text}"
+    yield "```text"
+    yield cast_reference_text()
+    yield "```"
+    yield f"- 전체 링크: {_video_link(video_id)}"
+    yield ""
+    yield "## Codex 작업 지시"
     if job_kind == "summary":
-        lines.append("- 아래 transcript chunk를 순서대로 읽고, 각 chunk의 핵심 사건/감정 변화를 먼저 정리합니다.")
-        lines.append("- chunk 정리를 바탕으로 에피소드 전체 흐름을 연결해 상세 요약을 작성합니다.")
-        lines.append("- 핵심 인물(2명 이상), 사건(2개 이상), 근거 링크(2개 이상)를 반드시 포함합니다.")
-        lines.append("- 이름 표기는 캐스트 레퍼런스 기준으로 보정합니다.")
-        lines.append("- 템플릿 문구(`이 구간은`, `라는 제목 그대로`)는 사용하지 않습니다.")
+        yield "- 아래 transcript chunk를 순서대로 읽고, 각 chunk의 핵심 사건/감정 변화를 먼저 정리합니다."
+        yield "- chunk 정리를 바탕으로 에피소드 전체 흐름을 연결해 상세 요약을 작성합니다."
+        yield "- 핵심 인물(2명 이상), 사건(2개 이상), 근거 링크(2개 이상)를 반드시 포함합니다."
+        yield "- 이름 표기는 캐스트 레퍼런스 기준으로 보정합니다."
+        yield "- 템플릿 문구(`이 구간은`, `라는 제목 그대로`)는 사용하지 않습니다."
     else:
-        lines.append("- 아래 transcript chunk를 순서대로 읽고 사건 단위로 요약합니다.")
-        lines.append("- 사건마다 `누가/왜/어떻게/결과`를 명시합니다.")
-        lines.append("- 사건마다 핵심 인물(2명 이상)과 근거 chunk 링크를 포함합니다.")
-        lines.append("- 한 에피소드에 사건이 여러 개면 모두 분리합니다.")
-    lines.append("")
-    lines.append("## Transcript Chunks")
+        yield "- 아래 transcript chunk를 순서대로 읽고 사건 단위로 요약합니다."
+        yield "- 사건마다 `누가/왜/어떻게/결과`를 명시합니다."
+        yield "- 사건마다 핵심 인물(2명 이상)과 근거 chunk 링크를 포함합니다."
+        yield "- 한 에피소드에 사건이 여러 개면 모두 분리합니다."
+    yield ""
+    yield "## Transcript Chunks"
     for idx, chunk in enumerate(chunks, start=1):
         start = int(chunk["start"])
         end = int(chunk["end"])
-        lines.append("")
-        lines.append(
+        yield ""
+        yield (
             f"### Chunk {idx} ({_sec_to_clock(start)}~{_sec_to_clock(end)}) "
             f"[바로가기]({_seek_link(video_id, start)})"
         )
-        lines.append(chunk["text"] or "(텍스트 없음)")
-    lines.append("")
-    lines.append("## 에피소드 결과 템플릿")
-    lines.append("```markdown")
+        yield chunk["text"] or "(텍스트 없음)"
+    yield ""
+    yield "## 에피소드 결과 템플릿"
+    yield "```markdown"
     if job_kind == "summary":
-        lines.append(
+        yield (
             f"## EPISODE|season={video.get('season')}|round={round_number or '?'}|"
             f"episode={episode_in_round or '?'}|video_id={video_id}"
         )
-        lines.append(f"- title: {title}")
-        lines.append(f"- youtube_url: {_video_link(video_id)}")
-        lines.append("- key_people: ")
-        lines.append("- one_line: ")
-        lines.append("- summary: ")
-        lines.append("- chunk_storyline:")
-        lines.append("  - Chunk 1 | 핵심 사건/대화/감정 변화")
-        lines.append("  - Chunk 2 | 핵심 사건/대화/감정 변화")
-        lines.append("- key_incidents:")
-        lines.append("  - 사건 1 | 관련 인물 | 사건 내용 | 갈등/반전")
-        lines.append("  - 사건 2 | 관련 인물 | 사건 내용 | 다음 전개")
-        lines.append("- evidence_links:")
-        lines.append("  - https://www.youtube.com/watch?v=...&t=...s")
-        lines.append("  - https://www.youtube.com/watch?v=...&t=...s")
+        yield f"- title: {title}"
+        yield f"- youtube_url: {_video_link(video_id)}"
+        yield "- key_people: "
+        yield "- one_line: "
+        yield "- summary: "
+        yield "- chunk_storyline:"
+        yield "  - Chunk 1 | 핵심 사건/대화/감정 변화"
+        yield "  - Chunk 2 | 핵심 사건/대화/감정 변화"
+        yield "- key_incidents:"
+        yield "  - 사건 1 | 관련 인물 | 사건 내용 | 갈등/반전"
+        yield "  - 사건 2 | 관련 인물 | 사건 내용 | 다음 전개"
+        yield "- evidence_links:"
+        yield "  - https://www.youtube.com/watch?v=...&t=...s"
+        yield "  - https://www.youtube.com/watch?v=...&t=...s"
     else:
-        lines.append(f"### 사건 1 | {video.get('season')}기-{round_number}회차-{episode_in_round or '?'}에피소드")
-        lines.append("- 핵심 인물:")
-        lines.append("- 갈등/사건 요약:")
-        lines.append("- 누가/왜/어떻게/결과:")
-        lines.append("- 근거 구간 링크:")
-        lines.append("- 영상 링크:")
-    lines.append("```")
-    return "\n".join(lines)
+        yield f"### 사건 1 | {video.get('season')}기-{round_number}회차-{episode_in_round or '?'}에피소드"
+        yield "- 핵심 인물:"
+        yield "- 갈등/사건 요약:"
+        yield "- 누가/왜/어떻게/결과:"
+        yield "- 근거 구간 링크:"
+        yield "- 영상 링크:"
+    yield "```"
+
+
+def build_episode_packet_markdown(
+    video: dict[str, Any],
+    chunk_chars: int = 1700,
+    job_kind: str = "analysis",
+    parts: _PacketParts | None = None,
+) -> str:
+    return "\n".join(_episode_packet_lines(video, chunk_chars, job_kind, parts))
+
+
+def write_episode_packet_markdown(
+    fp: TextIO,
+    video: dict[str, Any],
+    chunk_chars: int = 1700,
+    job_kind: str = "analysis",
+    parts: _PacketParts | None = None,
+) -> None:
+    _write_lines(fp, _episode_packet_lines(video, chunk_chars, job_kind, parts))
+
+
+def _episode_packet_filename(video: dict[str, Any]) -> str:
+    season = _to_int(video.get("season"))
+    round_number = _to_int(video.get("round_number") or video.get("episode"))
+    episode = _to_int(video.get("episode_in_round"))
+    slug = _slugify(video.get("title", "episode"))
+    return (
+        f"s{season:02d}_r{round_number:03d}_e{episode:03d}_"
+        f"{video['video_id']}_{slug}.md"
+    )
+
+
+def _write_episode_packet_file(
+    path: Path,
+    video: dict[str, Any],
+    chunk_chars: int,
+    job_kind: str,
+) -> _PacketParts:
+    chunks, people = _video_packet_parts(video, chunk_chars)
+    with path.open("w", encoding="utf-8") as fp:
+        write_episode_packet_markdown(
+            fp,
+            video,
+            chunk_chars=chunk_chars,
+            job_kind=job_kind,
+            parts=(chunks, people),
+        )
+    return chunks[:2], people
 
 
 def build_packet_readme(job: dict[str, Any], videos: list[dict[str, Any]]) -> str:
@@ -626,14 +714,14 @@ def cmd_context(repo: NasolRepository, job_id: int, output: str | None) -> int:
     if job["status"] == "pending":
         repo.set_codex_job_running(job_id)
         job = repo.get_codex_job(job_id) or job
-    content = build_context_markdown(repo, job)
     if output:
         out_path = Path(output)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(content, encoding="utf-8")
+        with out_path.open("w", encoding="utf-8") as fp:
+            write_context_markdown(fp, repo, job)
         print(f"Saved: {out_path}")
         return 0
-    print(content)
+    print(build_context_markdown(repo, job))
     return 0
 
 
@@ -643,6 +731,7 @@ def cmd_packet(
     output_dir: str,
     max_videos: int,
     chunk_chars: int,
+    workers: int | None = None,
 ) -> int:
     job = repo.get_codex_job(job_id)
     if not job:
@@ -652,34 +741,50 @@ def cmd_packet(
         repo.set_codex_job_running(job_id)
         job = repo.get_codex_job(job_id) or job
 
-    videos = _load_job_videos(repo, job, max_videos=max_videos)
     out_dir = Path(output_dir)
     episodes_dir = out_dir / "episodes"
     out_dir.mkdir(parents=True, exist_ok=True)
     episodes_dir.mkdir(parents=True, exist_ok=True)
 
+    # Videos stream from SQLite into worker processes with a bounded number in flight; only
+    # transcript-free metadata and the parts context.md needs (first two chunks, people) stay.
+    videos: list[dict[str, Any]] = []
+    context_parts: dict[str, _PacketParts] = {}
+    pending: deque[tuple[str, Future[_PacketParts]]] = deque()
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+    job_kind = _job_kind(job)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for video in _iter_job_videos(repo, job, max_videos=max_videos):
+            future = executor.submit(
+                _write_episode_packet_file,
+                episodes_dir / _episode_packet_filename(video),
+                video,
+                chunk_chars,
+                job_kind,
+            )
+            pending.append((video["video_id"], future))
+            videos.append(
+                {key: value for key, value in video.items() if key not in _TRANSCRIPT_FIELDS}
+            )
+            if len(pending) >= max_pending:
+                video_id, future = pending.popleft()
+                context_parts[video_id] = future.result()
+        for video_id, future in pending:
+            context_parts[video_id] = future.result()
+
     (out_dir / "README.md").write_text(build_packet_readme(job, videos), encoding="utf-8")
     (out_dir / "result_template.md").write_text(build_result_template(job, videos), encoding="utf-8")
-    (out_dir / "context.md").write_text(
-        build_context_markdown(repo, job, max_videos=max_videos, chunk_chars=chunk_chars),
-        encoding="utf-8",
-    )
 
-    for video in videos:
-        season = _to_int(video.get("season"))
-        round_number = _to_int(video.get("round_number") or video.get("episode"))
-        episode = _to_int(video.get("episode_in_round"))
-        slug = _slugify(video.get("title", "episode"))
-        filename = (
-            f"s{season:02d}_r{round_number:03d}_e{episode:03d}_"
-            f"{video['video_id']}_{slug}.md"
-        )
-        content = build_episode_packet_markdown(
-            video,
+    with (out_dir / "context.md").open("w", encoding="utf-8") as fp:
+        write_context_markdown(
+            fp,
+            repo,
+            job,
+            max_videos=max_videos,
             chunk_chars=chunk_chars,
-            job_kind=_job_kind(job),
+            video_parts=context_parts,
+            videos=videos,
         )
-        (episodes_dir / filename).write_text(content, encoding="utf-8")
 
     print(f"Saved packet: {out_dir}")
     print(f"- episodes: {len(videos)} files")
@@ -770,6 +875,7 @@ def main() -> int:
     packet_parser.add_argument("--output-dir", required=True)
     packet_parser.add_argument("--max-videos", type=int, default=3000)
     packet_parser.add_argument("--chunk-chars", type=int, default=1700)
+    packet_parser.add_argument("--workers", type=int, help="Episode worker processes (default: CPU count)")
 
     start_parser = subparsers.add_parser("start")
     start_parser.add_argument("--job-id", type=int, required=True)
@@ -794,7 +900,14 @@ def main() -> int:
     if args.command == "context":
         return cmd_context(repo, args.job_id, args.output)
     if args.command == "packet":
-        return cmd_packet(repo, args.job_id, args.output_dir, args.max_videos, args.chunk_chars)
+        return cmd_packet(
+            repo,
+            args.job_id,
+            args.output_dir,
+            args.max_videos,
+            args.chunk_chars,
+            workers=args.workers,
+        )
     if args.command == "start":
         return cmd_start(repo, args.job_id)
     if args.command == "complete":
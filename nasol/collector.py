@@ -1,19 +1,24 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
 import random
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Callable
 from urllib.parse import parse_qs, urlparse
 
+import requests
 import yt_dlp
+from requests.adapters import HTTPAdapter
 from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled, YouTubeTranscriptApi
 
-from nasol.cast import normalize_transcript_segments
+from nasol.cast import normalize_cast_mentions
 from nasol.parsing import (
     classify_series_type,
+    combine_for_match,
     ensure_season_list,
     is_pure_main_content,
     is_spinoff_content,
@@ -28,6 +33,23 @@ from nasol.storage import NasolRepository
 
 LogCallback = Callable[[str], None]
 
+# Fields of a yt-dlp video info dict that enrichment reads; only these are cached.
+_DETAIL_FIELDS = (
+    "title",
+    "description",
+    "upload_date",
+    "channel_id",
+    "channel_url",
+    "channel",
+    "uploader",
+    "duration",
+    "duration_string",
+    "timestamp",
+    "view_count",
+    "like_count",
+    "comment_count",
+)
+
 
 @dataclass
 class CollectorConfig:
@@ -36,6 +58,9 @@ class CollectorConfig:
     request_delay_seconds: float = 1.3
     transcript_delay_min: float = 2.5
     transcript_delay_max: float = 5.0
+    ytdlp_workers: int = 4
+    detail_cache_hours: float = 24.0 * 7
+    transcript_workers: int = 4
     max_search_results: int = 50
     max_retries: int = 3
     preferred_languages: tuple[str, ...] = ("ko", "ko-KR", "en", "en-US")
@@ -46,10 +71,40 @@ class CollectorConfig:
     max_season_window_days: int = 220
 
 
+class _TokenBucket:
+    # Thread-safe limiter: one token per `interval` seconds, holding at most `capacity`.
+    # Callers that find the bucket empty reserve a future token and sleep until it is due.
+    def __init__(self, interval: float, capacity: float = 1.0) -> None:
+        self._interval = interval
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self._interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated_at) / self._interval
+            self._tokens = min(self._capacity, self._tokens + refill) - 1
+            self._updated_at = now
+            wait = -self._tokens * self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
 class NasolCollector:
     def __init__(self, repository: NasolRepository, config: CollectorConfig | None = None) -> None:
         self.repo = repository
         self.config = config or CollectorConfig()
+        self._ytdlp_bucket = _TokenBucket(self.config.request_delay_seconds)
+        # The configured delay range sets the average transcript rate; idle time banks up
+        # to one request per worker instead of every fetch paying a random sleep.
+        self._transcript_bucket = _TokenBucket(
+            (self.config.transcript_delay_min + self.config.transcript_delay_max) / 2,
+            capacity=max(1, self.config.transcript_workers),
+        )
 
     def collect(
         self,
@@ -57,6 +112,8 @@ class NasolCollector:
         include_fallback_search: bool = True,
         dry_run: bool = False,
         force_transcript_refresh: bool = False,
+        force_metadata_refresh: bool = False,
+        deep_metadata: bool = True,
         logger: LogCallback | None = None,
     ) -> dict[str, Any]:
         selected_seasons = ensure_season_list(seasons)
@@ -96,9 +153,18 @@ class NasolCollector:
 
             merged_seeds = self._merge_seed_lists(official_seeds, fallback_seeds)
             total_candidates = len(merged_seeds)
-            log(f"후보 영상 {total_candidates}개 상세 메타데이터 조회 시작")
-
-            enriched = self._enrich_candidates(merged_seeds, selected_seasons, log)
+            if deep_metadata:
+                log(f"후보 영상 {total_candidates}개 상세 메타데이터 조회 시작")
+            else:
+                log(f"후보 영상 {total_candidates}개 목록 메타데이터만 사용")
+
+            enriched = self._enrich_candidates(
+                merged_seeds,
+                selected_seasons,
+                log,
+                use_cache=not force_metadata_refresh,
+                deep=deep_metadata,
+            )
             main_only = self._filter_main_only(enriched, playlist_seasons)
             log(f"본편 필터 적용: {len(enriched)} -> {len(main_only)}")
 
@@ -110,8 +176,7 @@ class NasolCollector:
             kept_candidates = len(ordered)
             log(f"중복 제거 완료: {len(enriched)} -> {kept_candidates}")
 
-            for payload in ordered:
-                self.repo.upsert_video(payload)
+            self.repo.upsert_videos(ordered)
 
             keep_by_season = self._build_keep_by_season(ordered)
             deleted_count = self.repo.delete_videos_not_in_set(selected_seasons, keep_by_season)
@@ -123,36 +188,48 @@ class NasolCollector:
             if dry_run:
                 log("Dry-run 모드: 대본 수집은 건너뜁니다.")
             else:
-                for idx, video in enumerate(ordered, start=1):
-                    video_id = video["video_id"]
-                    if not force_transcript_refresh and self.repo.video_has_transcript(video_id):
-                        if idx % 10 == 0:
-                            log(f"대본 진행 {idx}/{len(ordered)} (기존 대본 유지)")
-                        continue
-
-                    transcript = self._fetch_transcript(video_id)
-                    self.repo.update_transcript(video_id, transcript)
-
-                    if transcript["transcript_status"] == "success":
-                        transcript_success += 1
-                    else:
-                        transcript_fail += 1
-                        reason = transcript["transcript_status"]
-                        fail_reasons[reason] = fail_reasons.get(reason, 0) + 1
-
-                    if idx % 5 == 0 or transcript["transcript_status"] != "success":
-                        season = video.get("season")
-                        short_title = (video.get("title") or "")[:36]
-                        log(
-                            f"대본 {idx}/{len(ordered)} | {season}기 | "
-                            f"{short_title} | {transcript['transcript_status']}"
-                        )
-
-                    sleep_seconds = random.uniform(
-                        self.config.transcript_delay_min,
-                        self.config.transcript_delay_max,
+                transcribed: set[str] = set()
+                if not force_transcript_refresh:
+                    transcribed = self.repo.get_transcribed_video_ids(
+                        [video["video_id"] for video in ordered]
                     )
-                    time.sleep(sleep_seconds)
+                    if transcribed:
+                        log(f"기존 대본 유지 {len(transcribed)}/{len(ordered)}")
+                pending = [video for video in ordered if video["video_id"] not in transcribed]
+
+                # Fetches overlap on worker threads; SQLite writes and counters stay on this thread.
+                workers = max(1, self.config.transcript_workers)
+                http = requests.Session()
+                http.mount("https://", HTTPAdapter(pool_connections=workers, pool_maxsize=workers))
+                api = YouTubeTranscriptApi(http_client=http)
+                executor = ThreadPoolExecutor(max_workers=workers)
+                try:
+                    futures = {
+                        executor.submit(self._fetch_transcript_throttled, api, video["video_id"]): video
+                        for video in pending
+                    }
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        video = futures[future]
+                        transcript = future.result()
+                        self.repo.update_transcript(video["video_id"], transcript)
+
+                        if transcript["transcript_status"] == "success":
+                            transcript_success += 1
+                        else:
+                            transcript_fail += 1
+                            reason = transcript["transcript_status"]
+                            fail_reasons[reason] = fail_reasons.get(reason, 0) + 1
+
+                        if done % 5 == 0 or transcript["transcript_status"] != "success":
+                            season = video.get("season")
+                            short_title = (video.get("title") or "")[:36]
+                            log(
+                                f"대본 {done}/{len(pending)} | {season}기 | "
+                                f"{short_title} | {transcript['transcript_status']}"
+                            )
+                finally:
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    http.close()
 
             self.repo.finish_job(
                 job_id=job_id,
@@ -204,37 +281,42 @@ class NasolCollector:
         playlist_seasons: set[int] = set()
 
         playlist_url = f"https://www.youtube.com/{self.config.official_channel_handle}/playlists"
-        playlists = self._extract_entries(playlist_url)
-        matched_playlists = 0
-        for playlist in playlists:
+        matched_playlists: list[tuple[int, str]] = []
+        for playlist in self._extract_entries(playlist_url):
             playlist_title = (playlist.get("title") or "").strip()
             season = parse_first_season(playlist_title)
             if season not in seasons:
                 continue
-            matched_playlists += 1
-            url = playlist.get("url")
-            if not url:
-                continue
-            playlist_items = self._extract_entries(url)
-            for entry in playlist_items:
-                seed = self._seed_from_entry(
-                    entry,
-                    source="official_playlist",
-                    forced_season=season,
-                    is_official=True,
-                )
-                if seed:
-                    seeds[seed["video_id"]] = seed
-                    playlist_seasons.add(season)
+            matched_playlists.append((season, playlist.get("url") or ""))
+        fetch_playlists = [(season, url) for season, url in matched_playlists if url]
 
-            log(f"{season}기 플레이리스트 영상 {len(playlist_items)}개 탐색")
-            time.sleep(self.config.request_delay_seconds)
+        # yt-dlp walks a listing's continuation pages serially, so the parallelism is across
+        # listings: every matched playlist and the channel video list are fetched together.
+        videos_url = f"https://www.youtube.com/{self.config.official_channel_handle}/videos"
+        with ThreadPoolExecutor(max_workers=max(1, self.config.ytdlp_workers)) as executor:
+            channel_future = executor.submit(self._extract_entries_paced, videos_url)
+            playlist_results = executor.map(
+                self._extract_entries_paced,
+                [url for _, url in fetch_playlists],
+            )
+            for (season, _), playlist_items in zip(fetch_playlists, playlist_results):
+                for entry in playlist_items:
+                    seed = self._seed_from_entry(
+                        entry,
+                        source="official_playlist",
+                        forced_season=season,
+                        is_official=True,
+                    )
+                    if seed:
+                        seeds[seed["video_id"]] = seed
+                        playlist_seasons.add(season)
+
+                log(f"{season}기 플레이리스트 영상 {len(playlist_items)}개 탐색")
+            channel_entries = channel_future.result()
 
-        if matched_playlists == 0:
+        if not matched_playlists:
             log("공식 채널 플레이리스트 기반 기수 매칭이 없어 채널 영상 목록으로 보완합니다.")
 
-        videos_url = f"https://www.youtube.com/{self.config.official_channel_handle}/videos"
-        channel_entries = self._extract_entries(videos_url)
         matched_from_channel = 0
         for entry in channel_entries:
             title = entry.get("title", "")
@@ -256,7 +338,7 @@ class NasolCollector:
             matched_from_channel += 1
 
         log(
-            f"공식 채널 후보 수집 완료: 플레이리스트 {matched_playlists}개, "
+            f"공식 채널 후보 수집 완료: 플레이리스트 {len(matched_playlists)}개, "
             f"채널목록 매칭 {matched_from_channel}개"
         )
         return list(seeds.values()), playlist_seasons
@@ -284,7 +366,6 @@ class NasolCollector:
                 accepted += 1
 
             log(f"{season}기 일반 검색 후보 {accepted}개 확보")
-            time.sleep(self.config.request_delay_seconds)
 
         return list(seeds.values())
 
@@ -310,9 +391,13 @@ class NasolCollector:
 
         return [info]
 
+    def _extract_entries_paced(self, url: str) -> list[dict[str, Any]]:
+        self._ytdlp_bucket.acquire()
+        return self._extract_entries(url)
+
     def _search_entries(self, query: str, max_results: int) -> list[dict[str, Any]]:
         search_url = f"ytsearch{max_results}:{query}"
-        return self._extract_entries(search_url)
+        return self._extract_entries_paced(search_url)
 
     def _seed_from_entry(
         self,
@@ -332,15 +417,15 @@ class NasolCollector:
         round_number = parse_round_number(title)
         episode_in_round = parse_episode_in_round(title)
 
-        url = raw_url or f"https://www.youtube.com/watch?v={video_id}"
-        if not str(url).startswith("http"):
-            url = f"https://www.youtube.com/watch?v={video_id}"
+        watch_url = f"https://www.youtube.com/watch?v={video_id}"
+        url = raw_url if raw_url.startswith("http") else watch_url
 
         return {
             "video_id": video_id,
             "title": title,
             "description": description[:1200],
             "url": url,
+            "watch_url": watch_url,
             "season": season,
             "round_number": round_number,
             "episode": round_number,
@@ -348,6 +433,9 @@ class NasolCollector:
             "source": source,
             "is_official": is_official,
             "source_priority": 3 if is_official else 1,
+            "flat_detail": {
+                field: entry[field] for field in _DETAIL_FIELDS if entry.get(field) is not None
+            },
         }
 
     def _enrich_candidates(
@@ -355,7 +443,17 @@ class NasolCollector:
         seeds: list[dict[str, Any]],
         target_seasons: list[int],
         log: LogCallback,
+        use_cache: bool = True,
+        deep: bool = True,
     ) -> list[dict[str, Any]]:
+        if not deep:
+            # Listing entries only: counts, dates and channel fields are whatever they carried.
+            return [
+                payload
+                for seed in seeds
+                if (payload := self._build_payload(seed, seed["flat_detail"], target_seasons))
+            ]
+
         enriched: list[dict[str, Any]] = []
         options = {
             "quiet": True,
@@ -363,79 +461,120 @@ class NasolCollector:
             "skip_download": True,
             "ignoreerrors": True,
         }
-        with yt_dlp.YoutubeDL(options) as ydl:
-            for idx, seed in enumerate(seeds, start=1):
-                info = self._extract_video_detail(ydl, seed["video_id"])
-                if not info:
-                    continue
+        # A YoutubeDL instance is not safe to share, so each worker thread keeps its own.
+        local = threading.local()
+        instances: list[yt_dlp.YoutubeDL] = []
+        cache_hits: list[str] = []
+
+        def fetch_detail(seed: dict[str, Any]) -> dict[str, Any] | None:
+            video_id = seed["video_id"]
+            if use_cache and self.config.detail_cache_hours > 0:
+                cached = self.repo.get_cached_detail(video_id, self.config.detail_cache_hours)
+                if cached is not None:
+                    cache_hits.append(video_id)
+                    return cached
+            ydl = getattr(local, "ydl", None)
+            if ydl is None:
+                ydl = local.ydl = yt_dlp.YoutubeDL(options)
+                instances.append(ydl)
+            self._ytdlp_bucket.acquire()
+            info = self._extract_video_detail(ydl, seed["watch_url"])
+            if not info:
+                return None
+            detail = {field: info.get(field) for field in _DETAIL_FIELDS}
+            self.repo.save_cached_detail(video_id, detail)
+            return detail
 
-                title = (info.get("title") or seed.get("title") or "").strip()
-                description = (info.get("description") or seed.get("description") or "").strip()
-                inferred_season = seed.get("season") or parse_first_season(f"{title} {description}")
-                if inferred_season not in target_seasons:
-                    continue
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.config.ytdlp_workers)) as executor:
+                details = executor.map(fetch_detail, seeds)
+                for idx, (seed, info) in enumerate(zip(seeds, details), start=1):
+                    if not info:
+                        continue
+                    payload = self._build_payload(seed, info, target_seasons)
+                    if not payload:
+                        continue
+                    enriched.append(payload)
+
+                    if idx % 10 == 0:
+                        log(f"상세 메타데이터 {idx}/{len(seeds)} 처리")
+        finally:
+            for ydl in instances:
+                ydl.close()
+        if cache_hits:
+            log(f"상세 메타데이터 캐시 재사용 {len(cache_hits)}/{len(seeds)}")
+        return enriched
 
-                upload_date = parse_upload_date(info.get("upload_date")) or parse_upload_date(
-                    seed.get("upload_date")
-                )
-                round_number = seed.get("round_number") or parse_round_number(title)
-                episode_in_round = seed.get("episode_in_round") or parse_episode_in_round(title)
+    def _build_payload(
+        self,
+        seed: dict[str, Any],
+        info: dict[str, Any],
+        target_seasons: list[int],
+    ) -> dict[str, Any] | None:
+        title = (info.get("title") or seed.get("title") or "").strip()
+        description = (info.get("description") or seed.get("description") or "").strip()
+        inferred_season = seed.get("season") or parse_first_season(f"{title} {description}")
+        if inferred_season not in target_seasons:
+            return None
+        description = description[:4000]
+        combined = combine_for_match(title, description)
 
-                channel_id = info.get("channel_id") or seed.get("channel_id") or ""
-                channel_url = info.get("channel_url") or seed.get("channel_url") or ""
-                channel_name = info.get("channel") or info.get("uploader") or seed.get("channel_title")
+        upload_date = parse_upload_date(info.get("upload_date")) or parse_upload_date(
+            seed.get("upload_date")
+        )
+        round_number = seed.get("round_number") or parse_round_number(title)
+        episode_in_round = seed.get("episode_in_round") or parse_episode_in_round(title)
 
-                official = bool(
-                    seed.get("is_official")
-                    or channel_id == self.config.official_channel_id
-                    or self.config.official_channel_handle.lower() in (channel_url or "").lower()
-                )
-                source = seed.get("source", "general_search")
-                if official and source == "general_search":
-                    source = "official_channel"
-
-                payload = {
-                    "video_id": seed["video_id"],
-                    "title": title,
-                    "description": description[:4000],
-                    "url": f"https://www.youtube.com/watch?v={seed['video_id']}",
-                    "channel_title": channel_name or "",
-                    "channel_id": channel_id,
-                    "channel_url": channel_url,
-                    "duration_seconds": int(info.get("duration") or 0),
-                    "duration_text": info.get("duration_string") or "",
-                    "upload_date": upload_date,
-                    "published_ts": int(info.get("timestamp") or 0),
-                    "view_count": int(info.get("view_count") or 0),
-                    "like_count": int(info.get("like_count") or 0),
-                    "comment_count": int(info.get("comment_count") or 0),
-                    "season": inferred_season,
-                    "round_number": round_number,
-                    "episode": round_number,
-                    "episode_in_round": episode_in_round,
-                    "series_type": classify_series_type(title, description),
-                    "source": source,
-                    "is_official": official,
-                    "source_priority": 3 if official else 1,
-                }
-                payload["dedupe_key"] = make_dedupe_key(
-                    season=payload["season"],
-                    episode=payload.get("round_number"),
-                    upload_date=payload.get("upload_date"),
-                    title=payload.get("title", ""),
-                )
-                enriched.append(payload)
+        channel_id = info.get("channel_id") or seed.get("channel_id") or ""
+        channel_url = info.get("channel_url") or seed.get("channel_url") or ""
+        channel_name = info.get("channel") or info.get("uploader") or seed.get("channel_title")
 
-                if idx % 10 == 0:
-                    log(f"상세 메타데이터 {idx}/{len(seeds)} 처리")
+        official = bool(
+            seed.get("is_official")
+            or channel_id == self.config.official_channel_id
+            or self.config.official_channel_handle.lower() in (channel_url or "").lower()
+        )
+        source = seed.get("source", "general_search")
+        if official and source == "general_search":
+            source = "official_channel"
 
-                time.sleep(self.config.request_delay_seconds)
-        return enriched
+        payload = {
+            "video_id": seed["video_id"],
+            "title": title,
+            "description": description,
+            "url": seed["watch_url"],
+            "channel_title": channel_name or "",
+            "channel_id": channel_id,
+            "channel_url": channel_url,
+            "duration_seconds": int(info.get("duration") or 0),
+            "duration_text": info.get("duration_string") or "",
+            "upload_date": upload_date,
+            "published_ts": int(info.get("timestamp") or 0),
+            "view_count": int(info.get("view_count") or 0),
+            "like_count": int(info.get("like_count") or 0),
+            "comment_count": int(info.get("comment_count") or 0),
+            "season": inferred_season,
+            "round_number": round_number,
+            "episode": round_number,
+            "episode_in_round": episode_in_round,
+            "series_type": classify_series_type(title, description, combined=combined),
+            "source": source,
+            "is_official": official,
+            "source_priority": 3 if official else 1,
+            "_combined": combined,
+        }
+        payload["dedupe_key"] = make_dedupe_key(
+            season=payload["season"],
+            episode=payload.get("round_number"),
+            upload_date=payload.get("upload_date"),
+            title=payload.get("title", ""),
+        )
+        return payload
 
-    def _extract_video_detail(self, ydl: yt_dlp.YoutubeDL, video_id: str) -> dict[str, Any] | None:
+    def _extract_video_detail(self, ydl: yt_dlp.YoutubeDL, watch_url: str) -> dict[str, Any] | None:
         for attempt in range(1, self.config.max_retries + 1):
             try:
-                return ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+                return ydl.extract_info(watch_url, download=False)
             except Exception:  # pylint: disable=broad-except
                 if attempt >= self.config.max_retries:
                     return None
@@ -444,29 +583,20 @@ class NasolCollector:
         return None
 
     def _dedupe_candidates(self, videos: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        by_video_id: dict[str, dict[str, Any]] = {}
+        by_video_id: dict[str, list[dict[str, Any]]] = defaultdict(list)
         for video in videos:
-            existing = by_video_id.get(video["video_id"])
-            if not existing or self._is_higher_priority(video, existing):
-                by_video_id[video["video_id"]] = video
-        return list(by_video_id.values())
-
-    def _is_higher_priority(self, incoming: dict[str, Any], existing: dict[str, Any]) -> bool:
-        incoming_key = (
-            1 if incoming.get("is_official") else 0,
-            int(incoming.get("source_priority") or 0),
-            int(incoming.get("view_count") or 0),
-            int(incoming.get("comment_count") or 0),
-            incoming.get("upload_date") or "",
-        )
-        existing_key = (
-            1 if existing.get("is_official") else 0,
-            int(existing.get("source_priority") or 0),
-            int(existing.get("view_count") or 0),
-            int(existing.get("comment_count") or 0),
-            existing.get("upload_date") or "",
+            by_video_id[video["video_id"]].append(video)
+        # max() keeps the first of equal keys, as the old strict "higher priority" check did.
+        return [max(group, key=self._priority_key) for group in by_video_id.values()]
+
+    def _priority_key(self, video: dict[str, Any]) -> tuple[Any, ...]:
+        return (
+            1 if video.get("is_official") else 0,
+            int(video.get("source_priority") or 0),
+            int(video.get("view_count") or 0),
+            int(video.get("comment_count") or 0),
+            video.get("upload_date") or "",
         )
-        return incoming_key > existing_key
 
     def _sort_candidates(self, videos: list[dict[str, Any]]) -> list[dict[str, Any]]:
         return sorted(
@@ -481,11 +611,11 @@ class NasolCollector:
         )
 
     def _is_relevant_video(self, title: str, description: str, season: int) -> bool:
-        combined = f"{title} {description}".lower()
+        combined = combine_for_match(title, description)
         season_text = f"{season}기"
         if season_text not in combined:
             return False
-        return is_pure_main_content(title, description)
+        return is_pure_main_content(title, description, combined=combined)
 
     def _merge_seed_lists(
         self,
@@ -529,15 +659,16 @@ class NasolCollector:
             title = video.get("title", "")
             description = video.get("description", "")
             season = int(video.get("season") or 0)
+            combined = video.get("_combined")
 
-            if is_spinoff_content(title, description):
+            if is_spinoff_content(title, description, combined=combined):
                 continue
 
             if video.get("source") == "official_playlist" and season in playlist_seasons:
                 filtered.append(video)
                 continue
 
-            if is_pure_main_content(title, description):
+            if is_pure_main_content(title, description, combined=combined):
                 filtered.append(video)
         return filtered
 
@@ -714,7 +845,11 @@ class NasolCollector:
             keep[season].append(video["video_id"])
         return keep
 
-    def _fetch_transcript(self, video_id: str) -> dict[str, Any]:
+    def _fetch_transcript_throttled(self, api: YouTubeTranscriptApi, video_id: str) -> dict[str, Any]:
+        self._transcript_bucket.acquire()
+        return self._fetch_transcript(api, video_id)
+
+    def _fetch_transcript(self, api: YouTubeTranscriptApi, video_id: str) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "transcript_status": "error",
             "language": "",
@@ -725,7 +860,6 @@ class NasolCollector:
             "transcript_hash": "",
         }
         try:
-            api = YouTubeTranscriptApi()
             transcript_list = api.list(video_id)
 
             chosen = None
@@ -755,16 +889,18 @@ class NasolCollector:
                 return payload
 
             fetched = chosen.fetch()
-            raw_segments = [
-                {
-                    "start": float(getattr(segment, "start", 0.0)),
-                    "duration": float(getattr(segment, "duration", 0.0)),
-                    "text": str(getattr(segment, "text", "")).strip(),
-                }
-                for segment in fetched
-            ]
-            segments = normalize_transcript_segments(raw_segments)
-            transcript_text = "\n".join(segment["text"] for segment in segments)
+            # Same result as normalize_transcript_segments over the raw rows, in one pass.
+            segments: list[dict[str, Any]] = []
+            text_parts: list[str] = []
+            for segment in fetched:
+                start = float(getattr(segment, "start", 0.0))
+                duration = float(getattr(segment, "duration", 0.0))
+                text = normalize_cast_mentions(str(getattr(segment, "text", "")).strip())
+                if not text:
+                    continue
+                segments.append({"start": start, "duration": duration, "text": text})
+                text_parts.append(text)
+            transcript_text = "\n".join(text_parts)
             payload.update(
                 {
                     "transcript_status": "success",
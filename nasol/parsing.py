@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
+from datetime import date, datetime
+from functools import lru_cache
 from hashlib import sha1
 from typing import Iterable
 
@@ -49,8 +50,22 @@ EXCLUDE_KEYWORDS = (
 )
 
 
+def _keyword_re(keywords: Iterable[str]) -> re.Pattern[str]:
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_SPINOFF_RE = _keyword_re(SPINOFF_KEYWORDS)
+_MAIN_RE = _keyword_re(MAIN_KEYWORDS)
+_EXCLUDE_RE = _keyword_re(EXCLUDE_KEYWORDS)
+_WHITESPACE_RE = re.compile(r"\s+")
+_HASH_DROP_RE = re.compile(r"[^0-9A-Za-z가-힣 ]+")
+_TITLE_BRACKET_RE = re.compile(r"\[[^\]]+\]")
+_TITLE_PAREN_RE = re.compile(r"\([^)]*\)")
+_TITLE_NON_WORD_RE = re.compile(r"[^0-9A-Za-z가-힣]+")
+
+
 def clean_spaces(value: str) -> str:
-    return re.sub(r"\s+", " ", (value or "").strip())
+    return _WHITESPACE_RE.sub(" ", (value or "").strip())
 
 
 def parse_season_numbers(text: str, min_season: int = 1, max_season: int = 29) -> list[int]:
@@ -91,34 +106,39 @@ def parse_episode_in_round(text: str) -> int | None:
     return None
 
 
-def classify_series_type(title: str, description: str) -> str:
-    if is_spinoff_content(title, description):
+def combine_for_match(title: str, description: str) -> str:
+    return f"{title} {description}".lower()
+
+
+# Callers that classify the same video more than once pass `combined` from combine_for_match.
+def classify_series_type(title: str, description: str, *, combined: str | None = None) -> str:
+    combined = combined if combined is not None else combine_for_match(title, description)
+    if _SPINOFF_RE.search(combined):
         return "spinoff"
-    combined = f"{title} {description}".lower()
-    if any(keyword in combined for keyword in MAIN_KEYWORDS):
+    if _MAIN_RE.search(combined):
         return "main"
     return "unknown"
 
 
-def is_spinoff_content(title: str, description: str) -> bool:
-    combined = f"{title} {description}".lower()
-    return any(keyword in combined for keyword in SPINOFF_KEYWORDS)
+def is_spinoff_content(title: str, description: str, *, combined: str | None = None) -> bool:
+    combined = combined if combined is not None else combine_for_match(title, description)
+    return _SPINOFF_RE.search(combined) is not None
 
 
-def is_pure_main_content(title: str, description: str) -> bool:
-    combined = f"{title} {description}".lower()
-    if not any(keyword in combined for keyword in MAIN_KEYWORDS):
-        return False
-    if any(keyword in combined for keyword in EXCLUDE_KEYWORDS):
-        return False
-    return True
+def is_pure_main_content(title: str, description: str, *, combined: str | None = None) -> bool:
+    combined = combined if combined is not None else combine_for_match(title, description)
+    return _MAIN_RE.search(combined) is not None and _EXCLUDE_RE.search(combined) is None
 
 
 def normalize_title_for_key(title: str) -> str:
-    cleaned = re.sub(r"\[[^\]]+\]", " ", title or "")
-    cleaned = re.sub(r"\([^)]*\)", " ", cleaned)
-    cleaned = re.sub(r"[^0-9A-Za-z가-힣]+", " ", cleaned)
-    return clean_spaces(cleaned).lower()
+    # Brackets are removed before parentheses so overlapping pairs resolve as they always have.
+    cleaned = title or ""
+    if "[" in cleaned:
+        cleaned = _TITLE_BRACKET_RE.sub(" ", cleaned)
+    if "(" in cleaned:
+        cleaned = _TITLE_PAREN_RE.sub(" ", cleaned)
+    # Every non-word run, whitespace included, becomes one space, so only the ends need trimming.
+    return _TITLE_NON_WORD_RE.sub(" ", cleaned).strip().lower()
 
 
 def make_dedupe_key(season: int | None, episode: int | None, upload_date: str | None, title: str) -> str:
@@ -130,12 +150,12 @@ def make_dedupe_key(season: int | None, episode: int | None, upload_date: str |
 
 
 def normalize_text_for_hash(text: str) -> str:
-    lowered = (text or "").lower()
-    lowered = re.sub(r"\s+", " ", lowered)
-    lowered = re.sub(r"[^0-9A-Za-z가-힣 ]+", "", lowered)
-    return lowered.strip()
+    lowered = _WHITESPACE_RE.sub(" ", (text or "").lower())
+    return _HASH_DROP_RE.sub("", lowered).strip()
 
 
+# The collector hashes a fetched transcript and update_transcript hashes the same text again.
+@lru_cache(maxsize=64)
 def transcript_hash(text: str) -> str:
     normalized = normalize_text_for_hash(text)
     return sha1(normalized.encode("utf-8")).hexdigest()
@@ -145,6 +165,21 @@ def parse_upload_date(value: str | None) -> str | None:
     if not value:
         return None
 
+    # yt-dlp and stored rows use zero-padded YYYYMMDD / YYYY-MM-DD; slice those directly.
+    if len(value) == 8:
+        year, month, day = value[:4], value[4:6], value[6:]
+    elif len(value) == 10 and value[4] == value[7] and value[4] in "-./":
+        year, month, day = value[:4], value[5:7], value[8:]
+    else:
+        year = month = day = ""
+    digits = f"{year}{month}{day}"
+    if digits.isascii() and digits.isdigit() and year >= "1000":
+        try:
+            date(int(year), int(month), int(day))
+        except ValueError:
+            return None
+        return f"{year}-{month}-{day}"
+
     for pattern in ("%Y%m%d", "%Y-%m-%d", "%Y.%m.%d", "%Y/%m/%d"):
         try:
             return datetime.strptime(value, pattern).strftime("%Y-%m-%d")
@@ -1,15 +1,116 @@
 from __future__ import annotations
 
-import json
+import os
 import sqlite3
+import threading
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from nasol.cast import normalize_cast_mentions, normalize_transcript, normalize_transcript_segments
+import orjson
+
+from nasol.cast import (
+    cast_search_glob,
+    normalize_cast_mentions,
+    normalize_transcript,
+    normalize_transcript_segments,
+)
 from nasol.parsing import transcript_hash
 
+# Every videos column except the transcript text/segment blobs.
+_VIDEO_META_COLUMNS = """
+    video_id, title, url, channel_title, channel_id, channel_url, description,
+    duration_seconds, duration_text, upload_date, published_ts, view_count, like_count,
+    comment_count, season, round_number, episode, episode_in_round, series_type, source,
+    is_official, source_priority, dedupe_key, transcript_status, transcript_language,
+    transcript_type, transcript_hash, transcript_is_lower, transcript_updated_at, error_message,
+    discovered_at, updated_at
+"""
+
+_UPSERT_VIDEO_SQL = """
+    INSERT INTO videos (
+        video_id, title, url, channel_title, channel_id, channel_url, description,
+        duration_seconds, duration_text, upload_date, published_ts,
+        view_count, like_count, comment_count, season, round_number, episode,
+        episode_in_round, series_type,
+        source, is_official, source_priority, dedupe_key, discovered_at, updated_at
+    )
+    VALUES (
+        :video_id, :title, :url, :channel_title, :channel_id, :channel_url, :description,
+        :duration_seconds, :duration_text, :upload_date, :published_ts,
+        :view_count, :like_count, :comment_count, :season, :round_number, :episode,
+        :episode_in_round, :series_type,
+        :source, :is_official, :source_priority, :dedupe_key, :discovered_at, :updated_at
+    )
+    ON CONFLICT(video_id) DO UPDATE SET
+        title = excluded.title,
+        url = excluded.url,
+        channel_title = excluded.channel_title,
+        channel_id = excluded.channel_id,
+        channel_url = excluded.channel_url,
+        description = excluded.description,
+        duration_seconds = excluded.duration_seconds,
+        duration_text = excluded.duration_text,
+        upload_date = excluded.upload_date,
+        published_ts = excluded.published_ts,
+        view_count = excluded.view_count,
+        like_count = excluded.like_count,
+        comment_count = excluded.comment_count,
+        season = COALESCE(excluded.season, videos.season),
+        round_number = COALESCE(excluded.round_number, videos.round_number),
+        episode = COALESCE(excluded.episode, videos.episode),
+        episode_in_round = COALESCE(excluded.episode_in_round, videos.episode_in_round),
+        series_type = excluded.series_type,
+        source = CASE
+            WHEN excluded.source_priority >= videos.source_priority THEN excluded.source
+            ELSE videos.source
+        END,
+        is_official = CASE
+            WHEN excluded.source_priority >= videos.source_priority THEN excluded.is_official
+            ELSE videos.is_official
+        END,
+        source_priority = MAX(videos.source_priority, excluded.source_priority),
+        dedupe_key = COALESCE(excluded.dedupe_key, videos.dedupe_key),
+        updated_at = excluded.updated_at
+"""
+
+# get_videos sorts by exactly these expressions so SQLite can walk idx_videos_order instead of sorting.
+_VIDEO_ORDER_SQL = (
+    "COALESCE(season, 999), COALESCE(round_number, 9999), COALESCE(episode_in_round, 9999), "
+    "COALESCE(episode, 9999), COALESCE(upload_date, '9999-99-99'), video_id"
+)
+
+# Per-video engagement, indexed in idx_videos_season_summary; queries must repeat it verbatim.
+_ENGAGEMENT_SQL = "CASE WHEN view_count > 0 THEN CAST(comment_count AS REAL) / view_count ELSE 0 END"
+
+# Binds a whole list as one JSON parameter, so the SQL text (and its cached statement) doesn't
+# change with the list length and long lists stay clear of SQLite's bound-variable limit.
+_JSON_LIST_SQL = "(SELECT value FROM json_each(?))"
+
+_INITIALIZED_DB_PATHS: set[str] = set()
+_INIT_LOCK = threading.Lock()
+
+# Applied to every connection as it is opened; journal_mode=WAL is persisted by init_db.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-32768",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _dumps(value: Any) -> str:
+    return orjson.dumps(value).decode("utf-8")
+
+
+def _row_dicts(cursor: sqlite3.Cursor) -> Iterator[dict[str, Any]]:
+    # dict(sqlite3.Row) looks every column up by name; zipping positional values is much cheaper.
+    names = [column[0] for column in cursor.description]
+    for row in cursor:
+        yield dict(zip(names, row))
+
 
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -18,12 +119,27 @@ def utc_now() -> str:
 class NasolRepository:
     def __init__(self, db_path: str | Path = "output/nasol.db") -> None:
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.init_db()
+        self._local = threading.local()
+        # The app builds a repository per cached call; the schema only needs setting up once per
+        # database file and process, unless the file has since been removed.
+        init_key = os.path.abspath(self.db_path)
+        with _INIT_LOCK:
+            if init_key in _INITIALIZED_DB_PATHS and self.db_path.exists():
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self.init_db()
+            _INITIALIZED_DB_PATHS.add(init_key)
 
     def _connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(self.db_path)
-        connection.row_factory = sqlite3.Row
+        # One connection per thread, reused across calls; `with conn:` still scopes each
+        # transaction. It is closed when the thread or this repository goes away.
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, cached_statements=256)
+            connection.row_factory = sqlite3.Row
+            for pragma in _CONNECTION_PRAGMAS:
+                connection.execute(pragma)
+            self._local.connection = connection
         return connection
 
     def init_db(self) -> None:
@@ -62,13 +178,13 @@ class NasolRepository:
                     transcript_text TEXT,
                     transcript_segments TEXT,
                     transcript_hash TEXT,
+                    transcript_is_lower INTEGER,
                     transcript_updated_at TEXT,
                     error_message TEXT,
                     discovered_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_videos_season ON videos(season);
                 CREATE INDEX IF NOT EXISTS idx_videos_episode ON videos(episode);
                 CREATE INDEX IF NOT EXISTS idx_videos_upload_date ON videos(upload_date);
                 CREATE INDEX IF NOT EXISTS idx_videos_dedupe_key ON videos(dedupe_key);
@@ -143,6 +259,12 @@ class NasolRepository:
 
                 CREATE INDEX IF NOT EXISTS idx_codex_jobs_status ON codex_jobs(status);
                 CREATE INDEX IF NOT EXISTS idx_codex_jobs_created_at ON codex_jobs(created_at);
+
+                CREATE TABLE IF NOT EXISTS video_details (
+                    video_id TEXT PRIMARY KEY,
+                    fetched_at TEXT NOT NULL,
+                    payload_json TEXT NOT NULL
+                );
                 """
             )
             self._ensure_video_columns(conn)
@@ -153,6 +275,7 @@ class NasolRepository:
         required_columns = {
             "round_number": "INTEGER",
             "episode_in_round": "INTEGER",
+            "transcript_is_lower": "INTEGER",
         }
         existing = {
             row["name"]
@@ -168,6 +291,18 @@ class NasolRepository:
         conn.execute(
             "CREATE INDEX IF NOT EXISTS idx_videos_episode_in_round ON videos(episode_in_round)"
         )
+        # Leads with season like the old idx_videos_season (get_available_seasons skip-scans on it)
+        # and also covers get_season_summary.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_videos_season_summary "
+            f"ON videos(season, transcript_status, ({_ENGAGEMENT_SQL}))"
+        )
+        conn.execute("DROP INDEX IF EXISTS idx_videos_season")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_videos_order ON videos({_VIDEO_ORDER_SQL})")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_videos_transcript_done "
+            f"ON videos({_VIDEO_ORDER_SQL}) WHERE transcript_status = 'success'"
+        )
 
     def _ensure_codex_job_columns(self, conn: sqlite3.Connection) -> None:
         existing = {
@@ -188,10 +323,11 @@ class NasolRepository:
             return ""
 
         parsed_segments: list[dict[str, Any]] = []
-        if isinstance(raw_segments, str):
+        # Rows written before segments were stored as BLOBs hold the same JSON as TEXT.
+        if isinstance(raw_segments, (str, bytes)):
             try:
-                decoded = json.loads(raw_segments)
-            except json.JSONDecodeError:
+                decoded = orjson.loads(raw_segments)
+            except orjson.JSONDecodeError:
                 decoded = []
             if isinstance(decoded, list):
                 parsed_segments = decoded
@@ -201,7 +337,7 @@ class NasolRepository:
         normalized = normalize_transcript_segments(parsed_segments)
         if not normalized:
             return ""
-        return json.dumps(normalized, ensure_ascii=False)
+        return _dumps(normalized)
 
     def _normalize_video_payload(
         self,
@@ -231,7 +367,7 @@ class NasolRepository:
                 (
                     job_id,
                     now,
-                    json.dumps(seasons, ensure_ascii=False),
+                    _dumps(seasons),
                     1 if include_fallback else 0,
                     1 if dry_run else 0,
                 ),
@@ -280,9 +416,8 @@ class NasolRepository:
                 ),
             )
 
-    def upsert_video(self, video: dict[str, Any]) -> None:
-        now = utc_now()
-        payload = {
+    def _video_upsert_params(self, video: dict[str, Any], now: str) -> dict[str, Any]:
+        return {
             "video_id": video["video_id"],
             "title": video.get("title", "").strip() or "(제목 없음)",
             "url": video.get("url", f"https://www.youtube.com/watch?v={video['video_id']}"),
@@ -310,55 +445,15 @@ class NasolRepository:
             "updated_at": now,
         }
 
+    def upsert_video(self, video: dict[str, Any]) -> None:
+        self.upsert_videos([video])
+
+    def upsert_videos(self, videos: Iterable[dict[str, Any]]) -> None:
+        now = utc_now()
         with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO videos (
-                    video_id, title, url, channel_title, channel_id, channel_url, description,
-                    duration_seconds, duration_text, upload_date, published_ts,
-                    view_count, like_count, comment_count, season, round_number, episode,
-                    episode_in_round, series_type,
-                    source, is_official, source_priority, dedupe_key, discovered_at, updated_at
-                )
-                VALUES (
-                    :video_id, :title, :url, :channel_title, :channel_id, :channel_url, :description,
-                    :duration_seconds, :duration_text, :upload_date, :published_ts,
-                    :view_count, :like_count, :comment_count, :season, :round_number, :episode,
-                    :episode_in_round, :series_type,
-                    :source, :is_official, :source_priority, :dedupe_key, :discovered_at, :updated_at
-                )
-                ON CONFLICT(video_id) DO UPDATE SET
-                    title = excluded.title,
-                    url = excluded.url,
-                    channel_title = excluded.channel_title,
-                    channel_id = excluded.channel_id,
-                    channel_url = excluded.channel_url,
-                    description = excluded.description,
-                    duration_seconds = excluded.duration_seconds,
-                    duration_text = excluded.duration_text,
-                    upload_date = excluded.upload_date,
-                    published_ts = excluded.published_ts,
-                    view_count = excluded.view_count,
-                    like_count = excluded.like_count,
-                    comment_count = excluded.comment_count,
-                    season = COALESCE(excluded.season, videos.season),
-                    round_number = COALESCE(excluded.round_number, videos.round_number),
-                    episode = COALESCE(excluded.episode, videos.episode),
-                    episode_in_round = COALESCE(excluded.episode_in_round, videos.episode_in_round),
-                    series_type = excluded.series_type,
-                    source = CASE
-                        WHEN excluded.source_priority >= videos.source_priority THEN excluded.source
-                        ELSE videos.source
-                    END,
-                    is_official = CASE
-                        WHEN excluded.source_priority >= videos.source_priority THEN excluded.is_official
-                        ELSE videos.is_official
-                    END,
-                    source_priority = MAX(videos.source_priority, excluded.source_priority),
-                    dedupe_key = COALESCE(excluded.dedupe_key, videos.dedupe_key),
-                    updated_at = excluded.updated_at
-                """,
-                payload,
+            conn.executemany(
+                _UPSERT_VIDEO_SQL,
+                (self._video_upsert_params(video, now) for video in videos),
             )
 
     def update_transcript(self, video_id: str, transcript: dict[str, Any]) -> None:
@@ -367,6 +462,7 @@ class NasolRepository:
             segments=transcript.get("transcript_segments") or [],
         )
         normalized_hash = transcript_hash(normalized_text) if normalized_text else ""
+        now = utc_now()
         with self._connect() as conn:
             conn.execute(
                 """
@@ -377,6 +473,7 @@ class NasolRepository:
                     transcript_text = ?,
                     transcript_segments = ?,
                     transcript_hash = ?,
+                    transcript_is_lower = ?,
                     transcript_updated_at = ?,
                     error_message = ?,
                     updated_at = ?
@@ -387,11 +484,12 @@ class NasolRepository:
                     transcript.get("language", ""),
                     transcript.get("transcript_type", ""),
                     normalized_text,
-                    json.dumps(normalized_segments, ensure_ascii=False),
+                    orjson.dumps(normalized_segments),
                     normalized_hash,
-                    utc_now(),
+                    int(normalized_text == normalized_text.lower()),
+                    now,
                     transcript.get("error_message"),
-                    utc_now(),
+                    now,
                     video_id,
                 ),
             )
@@ -406,6 +504,33 @@ class NasolRepository:
             return None
         return self._normalize_video_payload(dict(row), include_segments=True)
 
+    def get_video_meta(self, video_id: str) -> dict[str, Any] | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {_VIDEO_META_COLUMNS} FROM videos WHERE video_id = ?",
+                (video_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return dict(row)
+
+    def get_video_transcript(
+        self,
+        video_id: str,
+        include_segments: bool = False,
+    ) -> dict[str, Any] | None:
+        columns = "video_id, transcript_text"
+        if include_segments:
+            columns = f"{columns}, transcript_segments"
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {columns} FROM videos WHERE video_id = ?",
+                (video_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return self._normalize_video_payload(dict(row), include_segments=include_segments)
+
     def video_has_transcript(self, video_id: str) -> bool:
         with self._connect() as conn:
             row = conn.execute(
@@ -418,14 +543,66 @@ class NasolRepository:
             ).fetchone()
         return bool(row and row["transcript_status"] == "success")
 
+    def get_transcribed_video_ids(self, video_ids: list[str]) -> set[str]:
+        if not video_ids:
+            return set()
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT video_id
+                FROM videos
+                WHERE transcript_status = 'success'
+                  AND video_id IN {_JSON_LIST_SQL}
+                """,
+                (_dumps(video_ids),),
+            ).fetchall()
+        return {row["video_id"] for row in rows}
+
+    def get_cached_detail(self, video_id: str, max_age_hours: float) -> dict[str, Any] | None:
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).isoformat(timespec="seconds")
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT payload_json
+                FROM video_details
+                WHERE video_id = ?
+                  AND fetched_at >= ?
+                """,
+                (video_id, cutoff),
+            ).fetchone()
+        if not row:
+            return None
+        return orjson.loads(row["payload_json"])
+
+    def save_cached_detail(self, video_id: str, detail: dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO video_details (video_id, fetched_at, payload_json)
+                VALUES (?, ?, ?)
+                ON CONFLICT(video_id) DO UPDATE SET
+                    fetched_at = excluded.fetched_at,
+                    payload_json = excluded.payload_json
+                """,
+                (video_id, utc_now(), _dumps(detail)),
+            )
+
     def get_available_seasons(self) -> list[int]:
         with self._connect() as conn:
+            # Skip-scan: each step is one idx_videos_season_summary seek to the next distinct season;
+            # this relies on that index keeping season as its first column.
             rows = conn.execute(
                 """
-                SELECT DISTINCT season
-                FROM videos
+                WITH RECURSIVE distinct_seasons(season) AS (
+                    SELECT MIN(season) FROM videos
+                    UNION ALL
+                    SELECT (SELECT MIN(season) FROM videos WHERE season > distinct_seasons.season)
+                    FROM distinct_seasons
+                    WHERE distinct_seasons.season IS NOT NULL
+                )
+                SELECT season
+                FROM distinct_seasons
                 WHERE season IS NOT NULL
-                ORDER BY season
                 """
             ).fetchall()
         return [int(row["season"]) for row in rows]
@@ -436,14 +613,41 @@ class NasolRepository:
         transcript_only: bool | None = None,
         main_only: bool | None = None,
         limit: int | None = None,
+        match_any: list[str] | None = None,
+        include_transcript: bool = True,
+        include_segments: bool = True,
     ) -> list[dict[str, Any]]:
+        return list(
+            self.iter_videos(
+                seasons=seasons,
+                transcript_only=transcript_only,
+                main_only=main_only,
+                limit=limit,
+                match_any=match_any,
+                include_transcript=include_transcript,
+                include_segments=include_segments,
+            )
+        )
+
+    def iter_videos(
+        self,
+        seasons: list[int] | None = None,
+        transcript_only: bool | None = None,
+        main_only: bool | None = None,
+        limit: int | None = None,
+        match_any: list[str] | None = None,
+        episode_order: bool = False,
+        include_transcript: bool = True,
+        include_segments: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        # Transcript text and raw segment JSON dominate row size; listings that only show
+        # metadata leave them out. Segments are only selected together with the text.
         clauses = []
         params: list[Any] = []
 
         if seasons:
-            placeholders = ",".join("?" for _ in seasons)
-            clauses.append(f"season IN ({placeholders})")
-            params.extend(seasons)
+            clauses.append(f"season IN {_JSON_LIST_SQL}")
+            params.append(_dumps(seasons))
 
         if transcript_only is True:
             clauses.append("transcript_status = 'success'")
@@ -455,24 +659,51 @@ class NasolRepository:
         elif main_only is False:
             clauses.append("series_type != 'main'")
 
+        if match_any:
+            # Rows that cannot contain any term once normalised are dropped in SQLite;
+            # callers still do the exact matching on what comes back.
+            patterns = [cast_search_glob(term) for term in match_any]
+            if all(patterns):
+                clauses.append(
+                    "(" + " OR ".join("title GLOB ? OR transcript_text GLOB ?" for _ in patterns) + ")"
+                )
+                for pattern in patterns:
+                    params.extend((pattern, pattern))
+
         where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         limit_sql = f"LIMIT {int(limit)}" if limit else ""
+        columns = _VIDEO_META_COLUMNS
+        if include_transcript:
+            columns = f"{columns}, transcript_text"
+            if include_segments:
+                columns = f"{columns}, transcript_segments"
         query = f"""
-            SELECT *
+            SELECT {columns}
             FROM videos
             {where_sql}
-            ORDER BY
-                COALESCE(season, 999),
-                COALESCE(round_number, 9999),
-                COALESCE(episode_in_round, 9999),
-                COALESCE(episode, 9999),
-                COALESCE(upload_date, '9999-99-99'),
-                video_id
+            ORDER BY {_VIDEO_ORDER_SQL}
             {limit_sql}
         """
+        if episode_order:
+            # Same rows (and limit) as above, re-sorted for episode packets: missing round or
+            # episode numbers go last within their season.
+            query = f"""
+                SELECT *
+                FROM ({query})
+                ORDER BY
+                    COALESCE(season, 0),
+                    COALESCE(NULLIF(round_number, 0), NULLIF(episode, 0), 9999),
+                    COALESCE(NULLIF(episode_in_round, 0), 9999),
+                    COALESCE(upload_date, ''),
+                    video_id
+            """
         with self._connect() as conn:
-            rows = conn.execute(query, params).fetchall()
-        return [self._normalize_video_payload(dict(row), include_segments=False) for row in rows]
+            rows = _row_dicts(conn.execute(query, params))
+            if not include_transcript:
+                yield from rows
+                return
+            for row in rows:
+                yield self._normalize_video_payload(row, include_segments=False)
 
     def delete_videos_not_in_set(self, seasons: list[int], keep_by_season: dict[int, list[str]]) -> int:
         if not seasons:
@@ -483,14 +714,13 @@ class NasolRepository:
             for season in seasons:
                 keep_ids = [video_id for video_id in keep_by_season.get(season, []) if video_id]
                 if keep_ids:
-                    placeholders = ",".join("?" for _ in keep_ids)
                     cursor = conn.execute(
                         f"""
                         DELETE FROM videos
                         WHERE season = ?
-                          AND video_id NOT IN ({placeholders})
+                          AND video_id NOT IN {_JSON_LIST_SQL}
                         """,
-                        [season, *keep_ids],
+                        (season, _dumps(keep_ids)),
                     )
                 else:
                     cursor = conn.execute(
@@ -507,9 +737,8 @@ class NasolRepository:
         clauses = []
         params: list[Any] = []
         if seasons:
-            placeholders = ",".join("?" for _ in seasons)
-            clauses.append(f"season IN ({placeholders})")
-            params.extend(seasons)
+            clauses.append(f"season IN {_JSON_LIST_SQL}")
+            params.append(_dumps(seasons))
 
         where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         query = f"""
@@ -517,15 +746,14 @@ class NasolRepository:
                 season,
                 COUNT(*) AS total_videos,
                 SUM(CASE WHEN transcript_status = 'success' THEN 1 ELSE 0 END) AS transcript_success,
-                ROUND(AVG(CASE WHEN view_count > 0 THEN CAST(comment_count AS REAL) / view_count ELSE 0 END), 6) AS avg_engagement
+                ROUND(AVG({_ENGAGEMENT_SQL}), 6) AS avg_engagement
             FROM videos
             {where_sql}
             GROUP BY season
             ORDER BY season
         """
         with self._connect() as conn:
-            rows = conn.execute(query, params).fetchall()
-        return [dict(row) for row in rows]
+            return list(_row_dicts(conn.execute(query, params)))
 
     def list_recent_jobs(self, limit: int = 10, status: str | None = None) -> list[dict[str, Any]]:
         params: list[Any] = []
@@ -535,7 +763,7 @@ class NasolRepository:
             params.append(status)
         params.append(limit)
         with self._connect() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 f"""
                 SELECT *
                 FROM jobs
@@ -544,12 +772,12 @@ class NasolRepository:
                 LIMIT ?
                 """,
                 params,
-            ).fetchall()
-        return [dict(row) for row in rows]
+            )
+            return list(_row_dicts(cursor))
 
     def get_job_logs(self, job_id: str, limit: int = 200) -> list[dict[str, Any]]:
         with self._connect() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT created_at, level, message
                 FROM job_logs
@@ -558,8 +786,8 @@ class NasolRepository:
                 LIMIT ?
                 """,
                 (job_id, limit),
-            ).fetchall()
-        return [dict(row) for row in rows]
+            )
+            return list(_row_dicts(cursor))
 
     def save_analysis_view(
         self,
@@ -569,38 +797,70 @@ class NasolRepository:
         seasons: list[int],
         items: list[dict[str, Any]],
     ) -> int:
-        created_at = utc_now()
         with self._connect() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO analysis_views (name, view_type, query, seasons_json, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (name, view_type, query, json.dumps(seasons, ensure_ascii=False), created_at),
-            )
-            view_id = int(cursor.lastrowid)
-            conn.executemany(
-                """
-                INSERT INTO analysis_view_items (view_id, video_id, season, episode, score, reason)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                [
-                    (
-                        view_id,
-                        item["video_id"],
-                        item.get("season"),
-                        item.get("episode"),
-                        float(item.get("score", 0.0)),
-                        item.get("reason", ""),
-                    )
-                    for item in items
-                ],
+            return self._insert_analysis_view(conn, name, view_type, query, seasons, items)
+
+    def save_analysis_exchange(
+        self,
+        query: str,
+        seasons: list[int],
+        response: str,
+        view: dict[str, Any] | None = None,
+    ) -> int | None:
+        # Chat row and optional view commit together in one transaction.
+        with self._connect() as conn:
+            self._insert_chat_exchange(conn, query, seasons, response)
+            if not view:
+                return None
+            return self._insert_analysis_view(
+                conn,
+                view["name"],
+                view["view_type"],
+                query,
+                seasons,
+                view["items"],
             )
+
+    def _insert_analysis_view(
+        self,
+        conn: sqlite3.Connection,
+        name: str,
+        view_type: str,
+        query: str,
+        seasons: list[int],
+        items: list[dict[str, Any]],
+    ) -> int:
+        created_at = utc_now()
+        cursor = conn.execute(
+            """
+            INSERT INTO analysis_views (name, view_type, query, seasons_json, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (name, view_type, query, _dumps(seasons), created_at),
+        )
+        view_id = int(cursor.lastrowid)
+        conn.executemany(
+            """
+            INSERT INTO analysis_view_items (view_id, video_id, season, episode, score, reason)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    view_id,
+                    item["video_id"],
+                    item.get("season"),
+                    item.get("episode"),
+                    float(item.get("score", 0.0)),
+                    item.get("reason", ""),
+                )
+                for item in items
+            ),
+        )
         return view_id
 
     def list_analysis_views(self, limit: int = 40) -> list[dict[str, Any]]:
         with self._connect() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT id, name, view_type, query, seasons_json, created_at
                 FROM analysis_views
@@ -608,11 +868,11 @@ class NasolRepository:
                 LIMIT ?
                 """,
                 (limit,),
-            ).fetchall()
+            )
+            rows = list(_row_dicts(cursor))
         results: list[dict[str, Any]] = []
-        for row in rows:
-            item = dict(row)
-            item["seasons"] = json.loads(item["seasons_json"])
+        for item in rows:
+            item["seasons"] = orjson.loads(item["seasons_json"])
             results.append(item)
         return results
 
@@ -630,7 +890,7 @@ class NasolRepository:
             if not view_row:
                 return None, []
 
-            item_rows = conn.execute(
+            item_cursor = conn.execute(
                 """
                 SELECT
                     i.video_id,
@@ -649,26 +909,35 @@ class NasolRepository:
                 ORDER BY i.score DESC, i.season ASC, i.episode ASC
                 """,
                 (view_id,),
-            ).fetchall()
+            )
+            items = list(_row_dicts(item_cursor))
 
         view = dict(view_row)
-        view["seasons"] = json.loads(view["seasons_json"])
-        items = [dict(row) for row in item_rows]
+        view["seasons"] = orjson.loads(view["seasons_json"])
         return view, items
 
     def save_chat_exchange(self, query: str, seasons: list[int], response: str) -> None:
         with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO analysis_chats (created_at, query, seasons_json, response)
-                VALUES (?, ?, ?, ?)
-                """,
-                (utc_now(), query, json.dumps(seasons, ensure_ascii=False), response),
-            )
+            self._insert_chat_exchange(conn, query, seasons, response)
+
+    def _insert_chat_exchange(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        seasons: list[int],
+        response: str,
+    ) -> None:
+        conn.execute(
+            """
+            INSERT INTO analysis_chats (created_at, query, seasons_json, response)
+            VALUES (?, ?, ?, ?)
+            """,
+            (utc_now(), query, _dumps(seasons), response),
+        )
 
     def list_chat_history(self, limit: int = 100) -> list[dict[str, Any]]:
         with self._connect() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 """
                 SELECT id, created_at, query, seasons_json, response
                 FROM analysis_chats
@@ -676,11 +945,11 @@ class NasolRepository:
                 LIMIT ?
                 """,
                 (limit,),
-            ).fetchall()
+            )
+            rows = list(_row_dicts(cursor))
         results: list[dict[str, Any]] = []
-        for row in rows:
-            payload = dict(row)
-            payload["seasons"] = json.loads(payload["seasons_json"])
+        for payload in rows:
+            payload["seasons"] = orjson.loads(payload["seasons_json"])
             results.append(payload)
         return results
 
@@ -692,7 +961,7 @@ class NasolRepository:
                 INSERT INTO codex_jobs (status, job_kind, query, seasons_json, created_at)
                 VALUES ('pending', ?, ?, ?, ?)
                 """,
-                (normalized_kind, query, json.dumps(seasons, ensure_ascii=False), utc_now()),
+                (normalized_kind, query, _dumps(seasons), utc_now()),
             )
         return int(cursor.lastrowid)
 
@@ -713,7 +982,7 @@ class NasolRepository:
         where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         params.append(limit)
         with self._connect() as conn:
-            rows = conn.execute(
+            cursor = conn.execute(
                 f"""
                 SELECT *
                 FROM codex_jobs
@@ -722,11 +991,11 @@ class NasolRepository:
                 LIMIT ?
                 """,
                 params,
-            ).fetchall()
+            )
+            rows = list(_row_dicts(cursor))
         results: list[dict[str, Any]] = []
-        for row in rows:
-            payload = dict(row)
-            payload["seasons"] = json.loads(payload["seasons_json"])
+        for payload in rows:
+            payload["seasons"] = orjson.loads(payload["seasons_json"])
             payload["job_kind"] = payload.get("job_kind") or "analysis"
             results.append(payload)
         return results
@@ -744,7 +1013,7 @@ class NasolRepository:
         if not row:
             return None
         payload = dict(row)
-        payload["seasons"] = json.loads(payload["seasons_json"])
+        payload["seasons"] = orjson.loads(payload["seasons_json"])
         payload["job_kind"] = payload.get("job_kind") or "analysis"
         return payload
 
@@ -6,11 +6,16 @@
 - 조회수 상위 50개 영상 선별
 """
 
+import argparse
 import os
-import json
+import re
+import sqlite3
 import time
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from heapq import nlargest
 from pathlib import Path
 from datetime import datetime
 
@@ -21,6 +26,13 @@ from config import (
     OUTPUT_DIR,
     TRANSCRIPT_LANGUAGES,
     REQUEST_DELAY,
+    MAX_WORKERS,
+    REQUEST_BURST,
+    MAX_REQUEST_DELAY,
+    CACHE_TTL_HOURS,
+    DETAIL_EARLY_STOP,
+    DETAIL_BATCH_SIZE,
+    MIN_DURATION_SECONDS,
 )
 
 
@@ -31,6 +43,7 @@ def check_dependencies():
         "youtube_transcript_api": "youtube-transcript-api",
         "pandas": "pandas",
         "tqdm": "tqdm",
+        "orjson": "orjson",
     }
     missing = []
     for module, pkg in packages.items():
@@ -47,10 +60,109 @@ def check_dependencies():
 
 check_dependencies()
 
+import orjson
 import yt_dlp
 import pandas as pd
 from tqdm import tqdm
-from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled
+from youtube_transcript_api import (
+    YouTubeTranscriptApi,
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    RequestBlocked,
+)
+
+
+class _TokenBucket:
+    """interval초마다 요청 한 개씩 채워지고 최대 capacity개까지 모아두는 요청 제한기"""
+
+    def __init__(self, interval: float, capacity: float, max_interval: float):
+        self._base_interval = interval
+        self._interval = interval
+        self._max_interval = max(max_interval, interval)
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        # 토큰이 없으면 다음 토큰을 미리 예약하고 그때까지 잔다 (응답 대기는 워커끼리 겹침)
+        with self._lock:
+            if self._interval <= 0:
+                return
+            now = time.monotonic()
+            refill = (now - self._updated_at) / self._interval
+            self._tokens = min(self._capacity, self._tokens + refill) - 1
+            self._updated_at = now
+            wait = -self._tokens * self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def penalize(self):
+        # 차단/429 응답: 간격을 두 배로 늘리고 모아둔 토큰도 버린다
+        with self._lock:
+            self._interval = min(self._max_interval, self._interval * 2 or 1.0)
+            self._tokens = min(self._tokens, 0.0)
+
+    def relax(self):
+        # 정상 응답마다 원래 간격 쪽으로 조금씩 되돌린다
+        with self._lock:
+            if self._interval > self._base_interval:
+                self._interval = max(self._base_interval, self._interval * 0.9)
+
+
+_request_bucket = _TokenBucket(REQUEST_DELAY, REQUEST_BURST, MAX_REQUEST_DELAY)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    return isinstance(error, RequestBlocked) or "429" in str(error)
+
+
+_cache_lock = threading.Lock()
+_cache_conn = None
+_cache_read = True
+
+
+def _open_cache(path: Path, use_cached: bool):
+    """상세 정보·대본 응답을 재실행 간에 재사용하는 SQLite 캐시 열기"""
+    global _cache_conn, _cache_read
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _cache_conn = sqlite3.connect(path, check_same_thread=False)
+    _cache_conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS responses (
+            kind TEXT NOT NULL,
+            key TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            payload BLOB NOT NULL,
+            PRIMARY KEY (kind, key)
+        )
+        """
+    )
+    _cache_conn.commit()
+    # --no-cache 실행은 캐시를 읽지 않고 새로 받은 결과로 덮어쓰기만 한다
+    _cache_read = use_cached
+
+
+def _cache_get(kind: str, key: str):
+    if _cache_conn is None or not _cache_read:
+        return None
+    with _cache_lock:
+        row = _cache_conn.execute(
+            "SELECT payload FROM responses WHERE kind = ? AND key = ? AND fetched_at >= ?",
+            (kind, key, time.time() - CACHE_TTL_HOURS * 3600),
+        ).fetchone()
+    return orjson.loads(row[0]) if row else None
+
+
+def _cache_put(kind: str, key: str, value):
+    if _cache_conn is None:
+        return
+    payload = orjson.dumps(value)
+    with _cache_lock, _cache_conn:
+        _cache_conn.execute(
+            "INSERT OR REPLACE INTO responses (kind, key, fetched_at, payload) VALUES (?, ?, ?, ?)",
+            (kind, key, time.time(), payload),
+        )
 
 
 def search_videos(query: str, max_results: int) -> list[dict]:
@@ -67,6 +179,7 @@ def search_videos(query: str, max_results: int) -> list[dict]:
     search_url = f"ytsearch{max_results}:{query}"
 
     try:
+        _request_bucket.acquire()
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(search_url, download=False)
             if info and "entries" in info:
@@ -82,57 +195,151 @@ def search_videos(query: str, max_results: int) -> list[dict]:
                         "channel": entry.get("channel") or entry.get("uploader", ""),
                         "upload_date": entry.get("upload_date", ""),
                         "description": (entry.get("description") or "")[:500],
+                        "live_status": entry.get("live_status") or "",
+                        "availability": entry.get("availability") or "",
                     })
+        _request_bucket.relax()
     except Exception as e:
+        if _is_rate_limited(e):
+            _request_bucket.penalize()
         print(f"  [경고] '{query}' 검색 오류: {e}")
 
     return results
 
 
-def get_video_details(video_ids: list[str]) -> dict[str, dict]:
-    """yt-dlp로 개별 영상의 정확한 조회수 등 상세 정보 수집"""
-    details = {}
-    ydl_opts = {
-        "quiet": True,
-        "no_warnings": True,
-        "skip_download": True,
-        "ignoreerrors": True,
+# 상세 정보나 대본 조회가 거의 항상 실패하거나 상위 목록에 맞지 않는 검색 결과
+_UNFIT_LIVE_STATUSES = {"is_live", "is_upcoming"}
+_UNFIT_AVAILABILITY = {"subscriber_only", "premium_only", "needs_auth"}
+
+
+def _is_unfit_candidate(video: dict) -> bool:
+    if video.get("live_status") in _UNFIT_LIVE_STATUSES:
+        return True
+    if video.get("availability") in _UNFIT_AVAILABILITY:
+        return True
+    # 길이를 모르는(0) 결과는 그대로 둔다
+    duration = video.get("duration") or 0
+    return 0 < duration < MIN_DURATION_SECONDS
+
+
+_DETAIL_YDL_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "ignoreerrors": True,
+}
+
+_thread_state = threading.local()
+_detail_ydls_lock = threading.Lock()
+_detail_ydls: list = []
+
+
+def _detail_ydl():
+    # YoutubeDL 인스턴스는 스레드 간에 공유하지 않고 워커마다 하나씩 재사용
+    ydl = getattr(_thread_state, "detail_ydl", None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(_DETAIL_YDL_OPTS)
+        _thread_state.detail_ydl = ydl
+        with _detail_ydls_lock:
+            _detail_ydls.append(ydl)
+    return ydl
+
+
+def _close_detail_ydls():
+    # 워커 풀이 끝난 뒤 호출: 스레드가 모두 종료됐으므로 닫힌 인스턴스를 다시 쓰는 일은 없다
+    with _detail_ydls_lock:
+        instances = _detail_ydls[:]
+        _detail_ydls.clear()
+    for ydl in instances:
+        ydl.close()
+
+
+def _fetch_one_detail(vid_id: str) -> dict | None:
+    url = f"https://www.youtube.com/watch?v={vid_id}"
+    try:
+        _request_bucket.acquire()
+        info = _detail_ydl().extract_info(url, download=False)
+    except Exception as e:
+        if _is_rate_limited(e):
+            _request_bucket.penalize()
+        # 워커 스레드에서 진행 막대가 떠 있는 동안 찍으므로 막대와 겹치지 않게 tqdm.write 사용
+        tqdm.write(f"  [경고] {vid_id} 상세 정보 오류: {e}")
+        return None
+    if not info:
+        return None
+    _request_bucket.relax()
+    return {
+        "video_id": vid_id,
+        "title": info.get("title", ""),
+        "url": url,
+        "view_count": info.get("view_count") or 0,
+        "like_count": info.get("like_count") or 0,
+        "comment_count": info.get("comment_count") or 0,
+        "duration": info.get("duration") or 0,
+        "duration_string": info.get("duration_string", ""),
+        "channel": info.get("channel") or info.get("uploader", ""),
+        "channel_id": info.get("channel_id", ""),
+        "channel_url": info.get("channel_url", ""),
+        "upload_date": info.get("upload_date", ""),
+        "description": (info.get("description") or "")[:1000],
+        "tags": info.get("tags") or [],
+        "categories": info.get("categories") or [],
+        "thumbnail": info.get("thumbnail", ""),
     }
 
-    print(f"\n[2단계] 상위 후보 영상 상세 정보 수집 중... ({len(video_ids)}개)")
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        for vid_id in tqdm(video_ids, desc="  상세 정보"):
-            try:
-                url = f"https://www.youtube.com/watch?v={vid_id}"
-                info = ydl.extract_info(url, download=False)
-                if info:
-                    details[vid_id] = {
-                        "video_id": vid_id,
-                        "title": info.get("title", ""),
-                        "url": url,
-                        "view_count": info.get("view_count") or 0,
-                        "like_count": info.get("like_count") or 0,
-                        "comment_count": info.get("comment_count") or 0,
-                        "duration": info.get("duration") or 0,
-                        "duration_string": info.get("duration_string", ""),
-                        "channel": info.get("channel") or info.get("uploader", ""),
-                        "channel_id": info.get("channel_id", ""),
-                        "channel_url": info.get("channel_url", ""),
-                        "upload_date": info.get("upload_date", ""),
-                        "description": (info.get("description") or "")[:1000],
-                        "tags": info.get("tags") or [],
-                        "categories": info.get("categories") or [],
-                        "thumbnail": info.get("thumbnail", ""),
-                    }
-                time.sleep(REQUEST_DELAY)
-            except Exception as e:
-                print(f"  [경고] {vid_id} 상세 정보 오류: {e}")
-
-    return details
+
+def get_video_details(video_ids: list[str], batch_size: int = 0, should_stop=None) -> dict[str, dict]:
+    """yt-dlp로 개별 영상의 정확한 조회수 등 상세 정보 수집
+
+    batch_size개씩 나눠 조회하고, 배치가 끝날 때마다 should_stop(지금까지의 상세 정보, 남은 ID)이
+    참이면 나머지는 조회하지 않는다. 모든 배치가 워커 풀(과 워커별 YoutubeDL) 하나를 함께 쓴다.
+    """
+    cached = {}
+    for vid_id in video_ids:
+        detail = _cache_get("detail", vid_id)
+        if detail is not None:
+            cached[vid_id] = detail
+
+    fetched = {}
+    reused = 0
+    batch_size = max(batch_size or len(video_ids), 1)
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, tqdm(
+            total=len(video_ids) - len(cached), desc="  상세 정보"
+        ) as progress:
+            for start in range(0, len(video_ids), batch_size):
+                futures = {}
+                for vid_id in video_ids[start:start + batch_size]:
+                    if vid_id in cached:
+                        fetched[vid_id] = cached[vid_id]
+                        reused += 1
+                    else:
+                        futures[executor.submit(_fetch_one_detail, vid_id)] = vid_id
+                for future in as_completed(futures):
+                    progress.update()
+                    detail = future.result()
+                    if detail:
+                        fetched[futures[future]] = detail
+                        _cache_put("detail", futures[future], detail)
+
+                remaining = video_ids[start + batch_size:]
+                if remaining and should_stop is not None and should_stop(fetched, remaining):
+                    break
+    finally:
+        _close_detail_ydls()
+
+    if reused:
+        print(f"  캐시 재사용: {reused}개")
+    # 완료 순서와 무관하게 후보 순서를 유지해야 조회수 동률 정렬 결과가 바뀌지 않는다
+    return {vid_id: fetched[vid_id] for vid_id in video_ids if vid_id in fetched}
 
 
 def get_transcript(video_id: str) -> dict:
     """youtube-transcript-api v1.x로 자막(대본) 다운로드"""
+    cached = _cache_get("transcript", video_id)
+    if cached is not None:
+        return cached
+
     result = {
         "has_transcript": False,
         "language": "",
@@ -142,6 +349,7 @@ def get_transcript(video_id: str) -> dict:
     }
 
     try:
+        _request_bucket.acquire()
         api = YouTubeTranscriptApi()
         transcript_list = api.list(video_id)
 
@@ -176,28 +384,91 @@ def get_transcript(video_id: str) -> dict:
             result["has_transcript"] = True
             result["language"] = chosen.language_code
             result["transcript_type"] = chosen_type
-            result["transcript_segments"] = [
-                {
-                    "start": getattr(seg, "start", 0),
-                    "duration": getattr(seg, "duration", 0),
-                    "text": getattr(seg, "text", "").strip(),
-                }
-                for seg in fetched
-            ]
-            result["transcript_text"] = "\n".join(
-                seg["text"] for seg in result["transcript_segments"] if seg["text"]
-            )
+            # 스니펫은 start/duration/text 속성을 항상 가지므로 getattr 없이 한 번에 처리
+            segments = []
+            lines = []
+            for seg in fetched:
+                text = seg.text.strip()
+                segments.append({"start": seg.start, "duration": seg.duration, "text": text})
+                if text:
+                    lines.append(text)
+            result["transcript_segments"] = segments
+            result["transcript_text"] = "\n".join(lines)
 
     except NoTranscriptFound:
         result["transcript_type"] = "not_found"
     except TranscriptsDisabled:
         result["transcript_type"] = "disabled"
     except Exception as e:
+        if _is_rate_limited(e):
+            _request_bucket.penalize()
         result["transcript_type"] = f"error: {str(e)[:100]}"
+        return result
 
+    _request_bucket.relax()
+    _cache_put("transcript", video_id, result)
     return result
 
 
+# \w는 str.isalnum()이 참인 문자와 밑줄이므로 기존 문자별 필터와 같은 결과
+_UNSAFE_TITLE_CHARS = re.compile(r"[^\w \-()\[\]]")
+
+# CSV 열 순서대로 영상 dict에서 읽을 키 (transcript_language ← language, 길이는 따로 계산)
+_CSV_SOURCE_KEYS = (
+    "rank",
+    "video_id",
+    "title",
+    "url",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "duration_string",
+    "channel",
+    "upload_date",
+    "has_transcript",
+    "language",
+    "transcript_type",
+)
+_CSV_COLUMNS = [
+    "rank",
+    "video_id",
+    "title",
+    "url",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "duration_string",
+    "channel",
+    "upload_date",
+    "has_transcript",
+    "transcript_language",
+    "transcript_type",
+    "transcript_length",
+]
+
+
+def save_transcript_txt(video: dict, transcripts_dir: Path) -> bool:
+    """대본이 있는 영상 하나를 텍스트 파일로 저장"""
+    if not video.get("has_transcript") or not video.get("transcript_text"):
+        return False
+    safe_title = _UNSAFE_TITLE_CHARS.sub("", video.get("title", "")[:50]).strip()
+    filename = f"{video['rank']:02d}_{video['video_id']}_{safe_title}.txt"
+    txt_path = transcripts_dir / filename
+    body = (
+        f"제목: {video.get('title', '')}\n"
+        f"URL: {video.get('url', '')}\n"
+        f"채널: {video.get('channel', '')}\n"
+        f"업로드: {video.get('upload_date', '')}\n"
+        f"조회수: {video.get('view_count', 0):,}\n"
+        f"자막 언어: {video.get('language', '')}\n"
+        f"자막 유형: {video.get('transcript_type', '')}\n"
+        f"{'=' * 60}\n\n"
+        f"{video.get('transcript_text', '')}"
+    )
+    txt_path.write_text(body, encoding="utf-8")
+    return True
+
+
 def save_results(videos: list[dict], output_dir: Path):
     """수집 결과를 JSON, CSV, 개별 텍스트 파일로 저장"""
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -207,55 +478,30 @@ def save_results(videos: list[dict], output_dir: Path):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # 1. 전체 JSON 저장
+    # transcript_text는 transcript_segments의 text를 줄바꿈으로 이은 것과 같아 JSON에서는 빼고
+    # 타이밍 정보가 있는 세그먼트만 남긴다 (전문은 CSV 길이 계산과 개별 txt 파일에서 그대로 사용)
     json_path = output_dir / f"nasol_top50_{timestamp}.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(videos, f, ensure_ascii=False, indent=2)
+    json_videos = [
+        {key: value for key, value in v.items() if key != "transcript_text"} for v in videos
+    ]
+    json_path.write_bytes(orjson.dumps(json_videos, option=orjson.OPT_INDENT_2))
     print(f"  [저장] JSON: {json_path}")
 
     # 2. CSV 저장 (대본 제외한 메타데이터)
-    rows = []
-    for v in videos:
-        rows.append({
-            "rank": v.get("rank"),
-            "video_id": v.get("video_id"),
-            "title": v.get("title"),
-            "url": v.get("url"),
-            "view_count": v.get("view_count"),
-            "like_count": v.get("like_count"),
-            "comment_count": v.get("comment_count"),
-            "duration_string": v.get("duration_string"),
-            "channel": v.get("channel"),
-            "upload_date": v.get("upload_date"),
-            "has_transcript": v.get("has_transcript"),
-            "transcript_language": v.get("language"),
-            "transcript_type": v.get("transcript_type"),
-            "transcript_length": len(v.get("transcript_text", "")),
-        })
-    df = pd.DataFrame(rows)
+    rows = [
+        (*map(v.get, _CSV_SOURCE_KEYS), len(v.get("transcript_text", "")))
+        for v in videos
+    ]
+    df = pd.DataFrame(rows, columns=_CSV_COLUMNS)
     csv_path = output_dir / f"nasol_top50_{timestamp}.csv"
     df.to_csv(csv_path, index=False, encoding="utf-8-sig")
     print(f"  [저장] CSV: {csv_path}")
 
-    # 3. 개별 대본 텍스트 파일 저장
-    saved_transcripts = 0
-    for v in videos:
-        if v.get("has_transcript") and v.get("transcript_text"):
-            safe_title = "".join(
-                c for c in v.get("title", "")[:50] if c.isalnum() or c in " _-()[]"
-            ).strip()
-            filename = f"{v['rank']:02d}_{v['video_id']}_{safe_title}.txt"
-            txt_path = transcripts_dir / filename
-            with open(txt_path, "w", encoding="utf-8") as f:
-                f.write(f"제목: {v.get('title', '')}\n")
-                f.write(f"URL: {v.get('url', '')}\n")
-                f.write(f"채널: {v.get('channel', '')}\n")
-                f.write(f"업로드: {v.get('upload_date', '')}\n")
-                f.write(f"조회수: {v.get('view_count', 0):,}\n")
-                f.write(f"자막 언어: {v.get('language', '')}\n")
-                f.write(f"자막 유형: {v.get('transcript_type', '')}\n")
-                f.write("=" * 60 + "\n\n")
-                f.write(v.get("transcript_text", ""))
-            saved_transcripts += 1
+    # 3. 개별 대본 텍스트 파일 저장 (파일마다 경로가 달라 동시에 써도 안전)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        saved_transcripts = sum(
+            executor.map(lambda v: save_transcript_txt(v, transcripts_dir), videos)
+        )
 
     print(f"  [저장] 대본 텍스트: {saved_transcripts}개 → {transcripts_dir}/")
 
@@ -263,6 +509,14 @@ def save_results(videos: list[dict], output_dir: Path):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="나는솔로 YouTube 스크래퍼")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="캐시된 상세 정보·대본을 무시하고 새로 조회 (결과는 캐시에 다시 저장)",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("  나는솔로 YouTube 스크래퍼")
     print("  조회수 상위 50개 영상 + 대본 수집")
@@ -271,65 +525,86 @@ def main():
     # 스크립트 위치 기준 output 디렉토리
     script_dir = Path(__file__).parent
     output_dir = script_dir / OUTPUT_DIR
+    _open_cache(output_dir / ".cache" / "scraper_cache.sqlite3", use_cached=not args.no_cache)
 
     # ─── 1단계: 여러 키워드로 영상 검색 ─────────────────────
     print(f"\n[1단계] YouTube 검색 중... (키워드 {len(SEARCH_QUERIES)}개)")
     all_videos: dict[str, dict] = {}
+    skipped_ids: set[str] = set()
 
-    for query in SEARCH_QUERIES:
-        print(f"  검색: '{query}'")
-        results = search_videos(query, MAX_RESULTS_PER_QUERY)
-        for v in results:
-            vid_id = v.get("video_id", "")
-            if vid_id and vid_id not in all_videos:
+    # 검색은 동시에 돌리되, 결과는 키워드 순서대로 합쳐서 중복 제거 기준을 유지
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(SEARCH_QUERIES) or 1)) as executor:
+        search_results = executor.map(
+            lambda query: search_videos(query, MAX_RESULTS_PER_QUERY), SEARCH_QUERIES
+        )
+        for query, results in zip(SEARCH_QUERIES, search_results):
+            print(f"  검색: '{query}'")
+            for v in results:
+                vid_id = v.get("video_id", "")
+                if not vid_id or vid_id in all_videos or vid_id in skipped_ids:
+                    continue
+                if _is_unfit_candidate(v):
+                    skipped_ids.add(vid_id)
+                    continue
                 all_videos[vid_id] = v
-        print(f"  → {len(results)}개 발견 (누적 고유 영상: {len(all_videos)}개)")
-        time.sleep(REQUEST_DELAY)
+            print(f"  → {len(results)}개 발견 (누적 고유 영상: {len(all_videos)}개)")
 
     print(f"\n  총 고유 영상: {len(all_videos)}개")
+    if skipped_ids:
+        print(f"  제외: 라이브/회원 전용/{MIN_DURATION_SECONDS}초 미만 영상 {len(skipped_ids)}개")
 
     # 조회수 기준 상위 후보 추려서 상세 정보 수집 (API 호출 최소화)
     # 검색 결과의 조회수로 1차 정렬 후 상위 150개만 상세 조회
-    candidates = sorted(
-        all_videos.values(),
-        key=lambda x: x.get("view_count", 0),
-        reverse=True
-    )[:min(150, len(all_videos))]
-
-    candidate_ids = [v["video_id"] for v in candidates if v.get("video_id")]
+    candidates = nlargest(150, all_videos.values(), key=lambda x: x.get("view_count", 0))
 
     # ─── 2단계: 상세 정보 수집 ───────────────────────────────
-    details = get_video_details(candidate_ids)
+    print(f"\n[2단계] 상위 후보 영상 상세 정보 수집 중... ({len(candidates)}개)")
+    search_views = {v["video_id"]: v.get("view_count", 0) for v in candidates}
+
+    def top_settled(details: dict[str, dict], remaining_ids: list[str]) -> bool:
+        # 남은 후보는 검색 조회수 내림차순이므로 맨 앞 후보만 확인하면 된다
+        if len(details) < TARGET_VIDEO_COUNT:
+            return False
+        top = nlargest(TARGET_VIDEO_COUNT, details.values(), key=lambda x: x.get("view_count", 0))
+        if top[-1].get("view_count", 0) > search_views[remaining_ids[0]]:
+            tqdm.write(f"  조기 종료: 남은 후보 {len(remaining_ids)}개는 상위 {TARGET_VIDEO_COUNT}개에 들 수 없어 생략")
+            return True
+        return False
+
+    details = get_video_details(
+        [v["video_id"] for v in candidates],
+        batch_size=DETAIL_BATCH_SIZE if DETAIL_EARLY_STOP else 0,
+        should_stop=top_settled if DETAIL_EARLY_STOP else None,
+    )
 
     # 조회수 기준 상위 50개 선별
-    sorted_videos = sorted(
-        details.values(),
-        key=lambda x: x.get("view_count", 0),
-        reverse=True
-    )[:TARGET_VIDEO_COUNT]
+    sorted_videos = nlargest(TARGET_VIDEO_COUNT, details.values(), key=lambda x: x.get("view_count", 0))
 
     print(f"\n  ✓ 최종 상위 {len(sorted_videos)}개 선별 완료")
 
     # ─── 3단계: 대본(자막) 수집 ─────────────────────────────
     print(f"\n[3단계] 대본(자막) 다운로드 중...")
-    final_videos = []
-
-    for rank, video in enumerate(tqdm(sorted_videos, desc="  대본 수집"), start=1):
-        vid_id = video["video_id"]
-        transcript_data = get_transcript(vid_id)
-
-        video.update(transcript_data)
-        video["rank"] = rank
-
-        status = "✓" if transcript_data["has_transcript"] else "✗"
-        lang = transcript_data.get("language", transcript_data.get("transcript_type", ""))
-        tqdm.write(
-            f"  [{rank:2d}] {status} {video['title'][:45]:<45} "
-            f"조회수:{video['view_count']:>12,}  자막:{lang}"
-        )
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(get_transcript, video["video_id"]): (rank, video)
+            for rank, video in enumerate(sorted_videos, start=1)
+        }
+        for future in tqdm(as_completed(futures), total=len(futures), desc="  대본 수집"):
+            rank, video = futures[future]
+            transcript_data = future.result()
+
+            video.update(transcript_data)
+            video["rank"] = rank
+
+            status = "✓" if transcript_data["has_transcript"] else "✗"
+            lang = transcript_data.get("language", transcript_data.get("transcript_type", ""))
+            tqdm.write(
+                f"  [{rank:2d}] {status} {video['title'][:45]:<45} "
+                f"조회수:{video['view_count']:>12,}  자막:{lang}"
+            )
 
-        final_videos.append(video)
-        time.sleep(REQUEST_DELAY)
+    # 완료 순서와 관계없이 저장은 순위 순서대로
+    final_videos = sorted_videos
 
     # ─── 4단계: 저장 ─────────────────────────────────────────
     print(f"\n[4단계] 결과 저장 중...")